@@ -1,6 +1,10 @@
 """Classes for magnetic field coils."""
 
+import copy
+import functools
+import mmap
 import numbers
+import re
 from abc import ABC
 from collections.abc import MutableSequence
 
@@ -12,12 +16,14 @@ from desc.backend import (
     jnp,
     scan,
     tree_leaves,
+    tree_map,
     tree_stack,
     tree_unstack,
+    use_jax,
     vmap,
 )
 from desc.compute import get_params, rpz2xyz, rpz2xyz_vec, xyz2rpz, xyz2rpz_vec
-from desc.compute.geom_utils import reflection_matrix
+from desc.compute.geom_utils import reflection_matrix, rotation_matrix
 from desc.compute.utils import _compute as compute_fun
 from desc.compute.utils import safenorm
 from desc.geometry import (
@@ -59,27 +65,35 @@ def biot_savart_hh(eval_pts, coil_pts_start, coil_pts_end, current):
     [1] Hanson & Hirshman, "Compact expressions for the Biot-Savart
     fields of a filamentary segment" (2002)
     """
+    # components are kept as separate (m,n) arrays rather than (m,n,3) so that
+    # the cross product and reduction vectorize over evaluation points on CPU
+    ex, ey, ez = eval_pts[:, 0], eval_pts[:, 1], eval_pts[:, 2]
     d_vec = coil_pts_end - coil_pts_start
-    L = jnp.linalg.norm(d_vec, axis=-1)
-
-    Ri_vec = eval_pts[jnp.newaxis, :] - coil_pts_start[:, jnp.newaxis, :]
-    Ri = jnp.linalg.norm(Ri_vec, axis=-1)
-    Rf = jnp.linalg.norm(
-        eval_pts[jnp.newaxis, :] - coil_pts_end[:, jnp.newaxis, :], axis=-1
-    )
+    dx, dy, dz = d_vec[:, 0, None], d_vec[:, 1, None], d_vec[:, 2, None]
+    L2 = jnp.sum(d_vec * d_vec, axis=-1)[:, jnp.newaxis]
+
+    rix = ex - coil_pts_start[:, 0, None]
+    riy = ey - coil_pts_start[:, 1, None]
+    riz = ez - coil_pts_start[:, 2, None]
+    Ri = jnp.sqrt(rix * rix + riy * riy + riz * riz)
+    rfx = ex - coil_pts_end[:, 0, None]
+    rfy = ey - coil_pts_end[:, 1, None]
+    rfz = ez - coil_pts_end[:, 2, None]
+    Rf = jnp.sqrt(rfx * rfx + rfy * rfy + rfz * rfz)
     Ri_p_Rf = Ri + Rf
 
     B_mag = (
         2.0e-7  #  == 2 * mu_0/(4 pi)
         * current
         * Ri_p_Rf
-        / (Ri * Rf * (Ri_p_Rf * Ri_p_Rf - (L * L)[:, jnp.newaxis]))
+        / (Ri * Rf * (Ri_p_Rf * Ri_p_Rf - L2))
     )
 
     # cross product of L*hat(eps)==d_vec with Ri_vec, scaled by B_mag
-    vec = jnp.cross(d_vec[:, jnp.newaxis, :], Ri_vec, axis=-1)
-    B = jnp.sum(B_mag[:, :, jnp.newaxis] * vec, axis=0)
-    return B
+    Bx = jnp.sum(B_mag * (dy * riz - dz * riy), axis=0)
+    By = jnp.sum(B_mag * (dz * rix - dx * riz), axis=0)
+    Bz = jnp.sum(B_mag * (dx * riy - dy * rix), axis=0)
+    return jnp.stack([Bx, By, Bz], axis=-1)
 
 
 @jit
@@ -158,16 +172,20 @@ def biot_savart_quad(eval_pts, coil_pts, tangents, current):
     converged. However in practice, for smooth curves described by Fourier series,
     this method converges exponentially in the number of coil points.
     """
-    dl = tangents
-    R_vec = eval_pts[jnp.newaxis, :] - coil_pts[:, jnp.newaxis, :]
-    R_mag = jnp.linalg.norm(R_vec, axis=-1)
-
-    vec = jnp.cross(dl[:, jnp.newaxis, :], R_vec, axis=-1)
-    denom = R_mag**3
-
+    # components are kept as separate (m,n) arrays rather than (m,n,3) so that
+    # the cross product and reduction vectorize over evaluation points on CPU
+    dlx, dly, dlz = tangents[:, 0, None], tangents[:, 1, None], tangents[:, 2, None]
+    rx = eval_pts[:, 0] - coil_pts[:, 0, None]
+    ry = eval_pts[:, 1] - coil_pts[:, 1, None]
+    rz = eval_pts[:, 2] - coil_pts[:, 2, None]
+    R2 = rx * rx + ry * ry + rz * rz
     # 1e-7 == mu_0/(4 pi)
-    B = jnp.sum(1.0e-7 * current * vec / denom[:, :, None], axis=0)
-    return B
+    scale = 1.0e-7 * current / (R2 * jnp.sqrt(R2))
+
+    Bx = jnp.sum(scale * (dly * rz - dlz * ry), axis=0)
+    By = jnp.sum(scale * (dlz * rx - dlx * rz), axis=0)
+    Bz = jnp.sum(scale * (dlx * ry - dly * rx), axis=0)
+    return jnp.stack([Bx, By, Bz], axis=-1)
 
 
 @jit
@@ -206,6 +224,45 @@ def biot_savart_vector_potential_quad(eval_pts, coil_pts, tangents, current):
     return A
 
 
+@functools.partial(jit, static_argnames=["op", "basis"])
+def _biot_savart_in_basis(op, eval_pts, coil_pts_a, coil_pts_b, current, basis="rpz"):
+    """Evaluate a Biot-Savart kernel at points given in [R,phi,Z] or [X,Y,Z].
+
+    The coordinate conversions are fused with the kernel itself, so that repeated
+    calls don't dispatch each operation separately. ``op`` and ``basis`` are static,
+    so one specialization is compiled for each kernel and basis, without the unused
+    conversion, and it is shared by all coils.
+
+    Parameters
+    ----------
+    op : callable
+        One of the ``biot_savart_*`` functions, called as
+        ``op(eval_pts, coil_pts_a, coil_pts_b, current)`` in cartesian coordinates.
+    eval_pts : array-like shape(n,3)
+        Evaluation points in [R,phi,Z] or [X,Y,Z] coordinates.
+    coil_pts_a, coil_pts_b : array-like shape(m,3)
+        Second and third arguments to ``op``, in cartesian coordinates.
+    current : float
+        Current through the coil (in Amps).
+    basis : {"rpz", "xyz"}
+        Basis for input coordinates and returned field.
+
+    Returns
+    -------
+    AB : ndarray, shape(n,3)
+        Magnetic field or vector potential at specified points, in the same basis
+        as the input points.
+
+    """
+    if basis == "rpz":
+        phi = eval_pts[:, 1]
+        eval_pts = rpz2xyz(eval_pts)
+    AB = op(eval_pts, coil_pts_a, coil_pts_b, current)
+    if basis == "rpz":
+        AB = xyz2rpz_vec(AB, phi=phi)
+    return AB
+
+
 class _Coil(_MagneticField, Optimizable, ABC):
     """Base class representing a magnetic field coil.
 
@@ -238,7 +295,7 @@ class _Coil(_MagneticField, Optimizable, ABC):
 
     @current.setter
     def current(self, new):
-        assert jnp.isscalar(new) or new.size == 1
+        assert isinstance(new, numbers.Number) or np.size(new) == 1
         self._current = float(np.squeeze(new))
 
     @property
@@ -325,9 +382,6 @@ class _Coil(_MagneticField, Optimizable, ABC):
         ]
         assert basis.lower() in ["rpz", "xyz"]
         coords = jnp.atleast_2d(jnp.asarray(coords))
-        if basis.lower() == "rpz":
-            phi = coords[:, 1]
-            coords = rpz2xyz(coords)
         if params is None:
             current = self.current
         else:
@@ -356,11 +410,14 @@ class _Coil(_MagneticField, Optimizable, ABC):
             data["x_s"] = rpz2xyz_vec(data["x_s"], phi=data["x"][:, 1])
             data["x"] = rpz2xyz(data["x"])
 
-        AB = op(coords, data["x"], data["x_s"] * data["ds"][:, None], current)
-
-        if basis.lower() == "rpz":
-            AB = xyz2rpz_vec(AB, phi=phi)
-        return AB
+        return _biot_savart_in_basis(
+            op,
+            coords,
+            data["x"],
+            data["x_s"] * data["ds"][:, None],
+            current,
+            basis=basis.lower(),
+        )
 
     def compute_magnetic_field(
         self, coords, params=None, basis="rpz", source_grid=None, transforms=None
@@ -1008,8 +1065,6 @@ class SplineXYZCoil(_Coil, SplineXYZCurve):
         op = {"B": biot_savart_hh, "A": biot_savart_vector_potential_hh}[compute_A_or_B]
         assert basis.lower() in ["rpz", "xyz"]
         coords = jnp.atleast_2d(jnp.asarray(coords))
-        if basis == "rpz":
-            coords = rpz2xyz(coords)
         if params is None:
             current = self.current
         else:
@@ -1028,11 +1083,9 @@ class SplineXYZCoil(_Coil, SplineXYZCurve):
         # coils curvature which is a 2nd derivative of the position, and doing that
         # with only possibly c1 cubic splines is inaccurate, so we don't do it
         # (for now, maybe in the future?)
-        AB = op(coords, coil_pts_start, coil_pts_end, current)
-
-        if basis == "rpz":
-            AB = xyz2rpz_vec(AB, x=coords[:, 0], y=coords[:, 1])
-        return AB
+        return _biot_savart_in_basis(
+            op, coords, coil_pts_start, coil_pts_end, current, basis=basis.lower()
+        )
 
     def compute_magnetic_field(
         self, coords, params=None, basis="rpz", source_grid=None, transforms=None
@@ -1163,6 +1216,95 @@ class SplineXYZCoil(_Coil, SplineXYZCurve):
         )
 
 
+# last line of each coil in a MAKEGRID file: X Y Z current followed by the group
+_MAKEGRID_COIL_END = re.compile(
+    rb"^[ \t]*(?:\S+[ \t]+){4}(\S[^\r\n]*?)[ \t]*\r?$", re.M
+)
+
+
+def _read_makegrid_coilfile(coil_file):
+    """Parse the points and coil groups of all coils in a MAKEGRID coil file.
+
+    The file is memory mapped and scanned once with a regular expression for the
+    last line of each coil, and the points of all coils are converted at once.
+
+    Parameters
+    ----------
+    coil_file : str or path-like
+        Path to coil file in txt format.
+
+    Returns
+    -------
+    coords : list of ndarray, shape(num_points,4)
+        X, Y, Z, current for the points of each coil, excluding the last line of
+        each coil which holds the coil group.
+    coilnames : list of str
+        The coil group (number and name) each coil belongs to.
+
+    """
+    with open(coil_file, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        headpos = mm.rfind(b"periods")
+        if headpos == -1:
+            return [], []
+        # skip anything that is above the periods line
+        mm.seek(mm.rfind(b"\n", 0, headpos) + 1)
+        header = [mm.readline() for _ in range(3)]
+        start = mm.tell()
+        first = mm.readline()
+        if len(first.split()) != 4:
+            raise OSError(
+                "4th line in file must be the start of the first coil! "
+                + "Expected a line of length 4 (after .split()), "
+                + f"instead got length {first.decode().split()}"
+            )
+        header_lines_not_as_expected = [len(line.split()) != 2 for line in header]
+        if np.any(header_lines_not_as_expected):
+            wronglines = [
+                header[i].decode() for i in np.where(header_lines_not_as_expected)[0]
+            ]
+            raise OSError(
+                "First 3 lines in file starting with the periods line "
+                + "must be the header lines,"
+                + " each of length 2 (after .split())! "
+                + f"Line(s) {wronglines}"
+                + " are not length 2"
+            )
+
+        blocks = []
+        coilnames = []
+        for match in _MAKEGRID_COIL_END.finditer(mm, start):
+            if any(
+                key in match.group(0) for key in (b"begin filament", b"end", b"mirror")
+            ):
+                continue  # skip headers and last line
+            blocks.append(mm[start : match.start()])
+            coilnames.append(" ".join(match.group(1).decode().split()))
+            start = match.end()
+
+    num_points = [len(block.split()) // 4 for block in blocks]
+    coords = np.array(b" ".join(blocks).decode().split(), dtype=float)
+    coords = np.split(coords.reshape((-1, 4)), np.cumsum(num_points)[:-1])
+    return coords, coilnames
+
+
+def _copy_coil(coil):
+    """Deep copy a coil, sharing its jax arrays with the original.
+
+    jax arrays are immutable, so there is no need to copy their buffers. Other
+    attributes such as bases and numpy arrays are still copied.
+    """
+    memo = {}
+    if use_jax:
+        memo = {
+            id(x): x
+            for x in tree_leaves(coil)
+            if isinstance(x, jnp.ndarray) and not isinstance(x, np.ndarray)
+        }
+    return copy.deepcopy(coil, memo)
+
+
 def _check_type(coil0, coil):
     errorif(
         not isinstance(coil, coil0.__class__),
@@ -1282,8 +1424,7 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
 
     @current.setter
     def current(self, new):
-        if jnp.isscalar(new):
-            new = [new] * len(self)
+        new = np.broadcast_to(new, (len(self),))
         for coil, cur in zip(self.coils, new):
             coil.current = cur
 
@@ -1331,6 +1472,31 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             List entries map to coils in coilset, each dict contains data for an
             individual coil.
 
+        """
+        return tree_unstack(
+            self._compute_stacked(
+                names,
+                grid=grid,
+                params=params,
+                transforms=transforms,
+                data=data,
+                **kwargs,
+            )
+        )
+
+    def _compute_stacked(
+        self,
+        names,
+        grid=None,
+        params=None,
+        transforms=None,
+        data=None,
+        **kwargs,
+    ):
+        """Compute quantities for all coils, stacked along a leading coil axis.
+
+        Same as ``compute``, but returns a single dict where each array has shape
+        (len(self), ...) instead of a list of dicts, one per coil.
         """
         if params is None:
             params = [
@@ -1341,12 +1507,11 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             data = [{}] * len(self)
 
         # if user supplied initial data for each coil we also need to vmap over that.
-        data = vmap(
+        return vmap(
             lambda d, x: self[0].compute(
                 names, grid=grid, transforms=transforms, data=d, params=x, **kwargs
             )
         )(tree_stack(data), tree_stack(params))
-        return tree_unstack(data)
 
     def translate(self, *args, **kwargs):
         """Translate the coils along an axis."""
@@ -1360,6 +1525,10 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
         """Flip the coils across a plane."""
         [coil.flip(*args, **kwargs) for coil in self.coils]
 
+    def _transform(self, M):
+        """Apply an orthogonal transformation matrix M to the coils in X,Y,Z."""
+        [coil._transform(M) for coil in self.coils]
+
     def _compute_position(self, params=None, grid=None, **kwargs):
         """Compute coil positions accounting for stellarator symmetry.
 
@@ -1380,9 +1549,10 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
         basis = kwargs.pop("basis", "xyz")
         if params is None:
             params = [get_params("x", coil, basis=basis) for coil in self]
-        data = self.compute("x", grid=grid, params=params, basis=basis, **kwargs)
-        data = tree_leaves(data, is_leaf=lambda x: isinstance(x, dict))
-        x = jnp.dstack([d["x"].T for d in data]).T  # shape=(ncoils,num_nodes,3)
+        data = self._compute_stacked(
+            "x", grid=grid, params=params, basis=basis, **kwargs
+        )
+        x = data["x"]  # shape=(ncoils,num_nodes,3)
 
         # stellarator symmetry is easiest in [X,Y,Z] coordinates
         if basis.lower() == "rpz":
@@ -1464,10 +1634,12 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             params = [
                 get_params(["x_s", "x", "s", "ds"], coil, basis=basis) for coil in self
             ]
-            for par, coil in zip(params, self):
-                par["current"] = coil.current
+            for par, current in zip(params, self.current):
+                par["current"] = current
 
-        # stellarator symmetry is easiest in [X,Y,Z] coordinates
+        # symmetry and field period rotations are applied in [X,Y,Z] coordinates,
+        # so that the field of each coil is computed without any coordinate
+        # conversions and the total is converted to the requested basis once
         if basis.lower() == "rpz":
             coords_xyz = rpz2xyz(coords)
         else:
@@ -1485,35 +1657,55 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             )
             coords_xyz = jnp.vstack((coords_xyz, coords_sym))
 
-        # field period rotation is easiest in [R,phi,Z] coordinates
-        coords_rpz = xyz2rpz(coords_xyz)
         op = {
             "B": self[0].compute_magnetic_field,
             "A": self[0].compute_magnetic_vector_potential,
         }[compute_A_or_B]
 
+        # all coils share the same parameterization, so we can batch over them.
+        # only one chunk of coils is vectorized at a time to keep memory use bounded,
+        # and any coils left over after the last full chunk are summed separately
+        params = tree_stack(params)
+        chunk_size = min(len(self), 8)
+        n_full = len(self) // chunk_size * chunk_size
+        chunks = tree_map(
+            lambda x: x[:n_full].reshape((-1, chunk_size) + x.shape[1:]), params
+        )
+        remainder = tree_map(lambda x: x[n_full:], params)
+
         # sum the magnetic fields from each field period
         def nfp_loop(k, AB):
-            coords_nfp = coords_rpz + jnp.array([0, 2 * jnp.pi * k / self.NFP, 0])
+            # evaluating at points rotated by 2pi k/NFP is equivalent to rotating the
+            # coils by -2pi k/NFP, after rotating the resulting field back
+            R = rotation_matrix(axis=[0, 0, 1], angle=2 * jnp.pi * k / self.NFP)
+            coords_nfp = coords_xyz @ R.T
 
             def body(AB, x):
-                AB += op(coords_nfp, params=x, basis="rpz", source_grid=source_grid)
+                AB += vmap(
+                    lambda y: op(
+                        coords_nfp, params=y, basis="xyz", source_grid=source_grid
+                    )
+                )(x).sum(axis=0)
                 return AB, None
 
-            AB += scan(body, jnp.zeros(coords_nfp.shape), tree_stack(params))[0]
-            return AB
+            AB_nfp = scan(body, jnp.zeros(coords_nfp.shape), chunks)[0]
+            if n_full < len(self):
+                AB_nfp = body(AB_nfp, remainder)[0]
+            return AB + AB_nfp @ R
 
-        AB = fori_loop(0, self.NFP, nfp_loop, jnp.zeros_like(coords_rpz))
+        AB = fori_loop(0, self.NFP, nfp_loop, jnp.zeros_like(coords_xyz))
 
-        # sum the magnetic field/potential from both halves of
-        # the symmetric field period
         if self.sym:
+            # sum the magnetic field/potential from both halves of
+            # the symmetric field period
+            AB = xyz2rpz_vec(AB, x=coords_xyz[:, 0], y=coords_xyz[:, 1])
             AB = AB[: coords.shape[0], :] + AB[coords.shape[0] :, :] * jnp.array(
                 [-1, 1, 1]
             )
-
-        if basis.lower() == "xyz":
-            AB = rpz2xyz_vec(AB, x=coords[:, 0], y=coords[:, 1])
+            if basis.lower() == "xyz":
+                AB = rpz2xyz_vec(AB, x=coords[:, 0], y=coords[:, 1])
+        elif basis.lower() == "rpz":
+            AB = xyz2rpz_vec(AB, phi=coords[:, 1])
         return AB
 
     def compute_magnetic_field(
@@ -1598,10 +1790,15 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             current = coil.current
         currents = jnp.broadcast_to(current, (n,))
         phi = jnp.linspace(0, angle, n, endpoint=endpoint)
+        # rotate all copies at once, equivalent to coil.rotate(axis, phi[i])
+        R = vmap(lambda a: rotation_matrix(axis=axis, angle=a))(phi)
+        rotmats = (R @ coil.rotmat.reshape((3, 3))).reshape((n, 9))
+        shifts = R @ coil.shift
         coils = []
         for i in range(n):
-            coili = coil.copy()
-            coili.rotate(axis=axis, angle=phi[i])
+            coili = _copy_coil(coil)
+            coili.rotmat = rotmats[i]
+            coili.shift = shifts[i]
             coili.current = currents[i]
             coils.append(coili)
         return cls(*coils)
@@ -1633,10 +1830,12 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
         currents = jnp.broadcast_to(current, (n,))
         displacement = jnp.asarray(displacement)
         a = jnp.linspace(0, 1, n, endpoint=endpoint)
+        # translate all copies at once, equivalent to coil.translate(a[i]*displacement)
+        shifts = coil.shift + a[:, None] * displacement
         coils = []
         for i in range(n):
-            coili = coil.copy()
-            coili.translate(a[i] * displacement)
+            coili = _copy_coil(coil)
+            coili.shift = shifts[i]
             coili.current = currents[i]
             coils.append(coili)
         return cls(*coils)
@@ -1670,6 +1869,12 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             The total number of coils in the new coil set is:
             len(coilset) = len(coils) * NFP * (int(sym) + 1)
 
+        Notes
+        -----
+        This creates a copy of every coil. When only the magnetic field is needed,
+        ``CoilSet(coils, NFP=NFP, sym=sym)`` represents the same coils implicitly
+        and sums the field over field periods in a single ``fori_loop``.
+
         """
         if not isinstance(coils, CoilSet):
             try:
@@ -1690,17 +1895,21 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
             # at [pi/6, pi/2, 5pi/6, 7pi/6, 3pi/2, 11pi/6]
             flipped_coils = []
             normal = jnp.array([-jnp.sin(jnp.pi / NFP), jnp.cos(jnp.pi / NFP), 0])
+            # compose both reflections into a single matrix once for all coils
+            F = reflection_matrix([0, 0, 1]) @ reflection_matrix(normal)
             for coil in coils[::-1]:
                 fcoil = coil.copy()
-                fcoil.flip(normal)
-                fcoil.flip([0, 0, 1])
+                fcoil._transform(F)
                 fcoil.current = -1 * coil.current
                 flipped_coils.append(fcoil)
             coils = coils + flipped_coils
-        # next rotate the coilset for each field period
+        # next rotate the coilset for each field period, computing the rotation
+        # matrices for all field periods at once
+        angles = 2 * jnp.pi * jnp.arange(NFP) / NFP
+        R = vmap(lambda a: rotation_matrix(axis=[0, 0, 1], angle=a))(angles)
         for k in range(0, NFP):
             rotated_coils = coils.copy()
-            rotated_coils.rotate(axis=[0, 0, 1], angle=2 * jnp.pi * k / NFP)
+            rotated_coils._transform(R[k])
             coilset += rotated_coils
 
         return cls(*coilset)
@@ -1734,66 +1943,7 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
 
         """
         coils = []  # list of SplineXYZCoils, ignoring coil groups
-        coilinds = [2]  # List of line indices where coils are at in the file.
-        # always start at the 3rd line after periods
-        coilnames = []  # the coilgroup each coil belongs to
-        # corresponds to each coil in the coilinds list
-
-        # read in the coils file
-        headind = -1
-        with open(coil_file) as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines):
-                if line.find("periods") != -1:
-                    headind = i  # skip anything that is above the periods line
-                    coilinds[0] += headind
-                    if len(lines[3 + headind].split()) != 4:
-                        raise OSError(
-                            "4th line in file must be the start of the first coil! "
-                            + "Expected a line of length 4 (after .split()), "
-                            + f"instead got length {lines[3+headind].split()}"
-                        )
-                    header_lines_not_as_expected = np.array(
-                        [
-                            len(lines[0 + headind].split()) != 2,
-                            len(lines[1 + headind].split()) != 2,
-                            len(lines[2 + headind].split()) != 2,
-                        ]
-                    )
-                    if np.any(header_lines_not_as_expected):
-                        wronglines = lines[
-                            np.where(header_lines_not_as_expected)[0] + headind
-                        ]
-                        raise OSError(
-                            "First 3 lines in file starting with the periods line "
-                            + "must be the header lines,"
-                            + " each of length 2 (after .split())! "
-                            + f"Line(s) {wronglines}"
-                            + " are not length 2"
-                        )
-
-                    continue
-                if (
-                    line.find("begin filament") != -1
-                    or line.find("end") != -1
-                    or line.find("mirror") != -1
-                ):
-                    continue  # skip headers and last line
-                if (
-                    len(line.split()) != 4  # find the line immediately before a coil,
-                    # where the line length is greater than 4
-                    and line.strip()  # ensure not counting blank lines
-                    # if we have not found the header yet, skip the line
-                    and headind != -1
-                ):
-                    coilinds.append(i)
-                    groupname = " ".join(line.split()[4:])
-                    coilnames.append(groupname)
-
-        for i, (start, end, coilname) in enumerate(
-            zip(coilinds[0:-1], coilinds[1:], coilnames)
-        ):
-            coords = np.genfromtxt(lines[start + 1 : end])
+        for coords, coilname in zip(*_read_makegrid_coilfile(coil_file)):
             coils.append(
                 SplineXYZCoil(
                     coords[:, -1][0],
@@ -1870,69 +2020,39 @@ class CoilSet(OptimizableCollection, _Coil, MutableSequence):
         )
         footer = "end\n"
 
-        x_arr = []
-        y_arr = []
-        z_arr = []
-        currents_arr = []
-        coil_end_inds = []  # indices where the coils end, need to track these
-        # to place the coilgroup number and name later, which MAKEGRID expects
-        # at the end of each individual coil
         if hasattr(grid, "endpoint"):
             endpoint = grid.endpoint
         elif isinstance(grid, numbers.Integral) or grid is None:
             # if int or None, will create a grid w/ endpoint=False in compute
             endpoint = False
-        for i in range(int(len(coils))):
-            coil = coils[i]
-            coords = coil.compute("x", basis="xyz", grid=grid)["x"]
-
-            contour_X = np.asarray(coords[0:, 0])
-            contour_Y = np.asarray(coords[0:, 1])
-            contour_Z = np.asarray(coords[0:, 2])
-
-            currents = np.ones_like(contour_X) * float(coil.current)
-            if endpoint:
-                currents[-1] = 0  # this last point must have 0 current
-            else:  # close the curves if needed
-                contour_X = np.append(contour_X, contour_X[0])
-                contour_Y = np.append(contour_Y, contour_Y[0])
-                contour_Z = np.append(contour_Z, contour_Z[0])
-                currents = np.append(currents, 0)  # this last point must have 0 current
-
-            coil_end_inds.append(contour_X.size)
-
-            x_arr.append(contour_X)
-            y_arr.append(contour_Y)
-            z_arr.append(contour_Z)
-            currents_arr.append(currents)
-        # form full array to save
-        x_arr = np.concatenate(x_arr)
-        y_arr = np.concatenate(y_arr)
-        z_arr = np.concatenate(z_arr)
-        currents_arr = np.concatenate(currents_arr)
-
-        save_arr = np.vstack((x_arr, y_arr, z_arr, currents_arr)).T
-        # save initial file
-        np.savetxt(
-            coilsFilename,
-            save_arr,
-            delimiter=" ",
-            header=header,
-            footer=footer,
-            fmt="%14.12e",
-            comments="",  # to avoid the # appended to the start of the header/footer
-        )
-        # now need to re-load the file and place coilgroup markers at end of each coil
-        with open(coilsFilename) as f:
-            lines = f.readlines()
-        for i in range(len(coil_end_inds)):
-            name = coils[i].name if coils[i].name != "" else "1 Modular"
-            real_end_ind = int(
-                np.sum(coil_end_inds[0 : i + 1]) + 2
-            )  # to account for the 3 header lines
-            lines[real_end_ind] = lines[real_end_ind].strip("\n") + f" {name}\n"
-        with open(coilsFilename, "w") as f:
-            f.writelines(lines)
+
+        # write through a large binary buffer, so large coil sets are written in
+        # few system calls
+        with open(coilsFilename, "wb", buffering=1 << 20) as f:
+            f.write((header + "\n").encode())
+            for coil in coils:
+                coords = np.asarray(coil.compute("x", basis="xyz", grid=grid)["x"])
+                if not endpoint:  # close the curves if needed
+                    coords = np.vstack([coords, coords[:1]])
+                contour = np.column_stack(
+                    [coords, np.full(coords.shape[0], float(coil.current))]
+                )
+                contour[-1, 3] = 0  # this last point must have 0 current
+                # MAKEGRID expects the coilgroup number and name at the end
+                # of each individual coil
+                name = coil.name if coil.name != "" else "1 Modular"
+                np.savetxt(
+                    f, contour[:-1], fmt="%14.12e", delimiter=" ", encoding="utf-8"
+                )
+                np.savetxt(
+                    f,
+                    contour[-1:],
+                    fmt="%14.12e",
+                    delimiter=" ",
+                    newline=f" {name}\n",
+                    encoding="utf-8",
+                )
+            f.write((footer + "\n").encode())
 
     def to_FourierPlanar(
         self, N=10, grid=None, basis="xyz", name="", check_intersection=True
@@ -2251,6 +2371,18 @@ class MixedCoilSet(CoilSet):
         if check_intersection:
             self.is_self_intersecting()
 
+    @property
+    def current(self):
+        """list: currents in each coil."""
+        return [coil.current for coil in self.coils]
+
+    @current.setter
+    def current(self, new):
+        if isinstance(new, numbers.Number) or getattr(new, "shape", None) == ():
+            new = [new] * len(self)
+        for coil, cur in zip(self.coils, new):
+            coil.current = cur
+
     @property
     def num_coils(self):
         """int: Number of coils."""
@@ -2386,17 +2518,13 @@ class MixedCoilSet(CoilSet):
         source_grid = self._make_arraylike(source_grid)
         transforms = self._make_arraylike(transforms)
 
+        op = {"B": "compute_magnetic_field", "A": "compute_magnetic_vector_potential"}[
+            compute_A_or_B
+        ]
+
         AB = 0
-        if compute_A_or_B == "B":
-            for coil, par, grd, tr in zip(self.coils, params, source_grid, transforms):
-                AB += coil.compute_magnetic_field(
-                    coords, par, basis, grd, transforms=tr
-                )
-        elif compute_A_or_B == "A":
-            for coil, par, grd, tr in zip(self.coils, params, source_grid, transforms):
-                AB += coil.compute_magnetic_vector_potential(
-                    coords, par, basis, grd, transforms=tr
-                )
+        for coil, par, grd, tr in zip(self.coils, params, source_grid, transforms):
+            AB += getattr(coil, op)(coords, par, basis, grd, transforms=tr)
         return AB
 
     def compute_magnetic_field(
@@ -2610,9 +2738,7 @@ class MixedCoilSet(CoilSet):
         self._coils.insert(i, new_item)
 
     @classmethod
-    def from_makegrid_coilfile(  # noqa: C901 - FIXME: simplify this
-        cls, coil_file, method="cubic", ignore_groups=False
-    ):
+    def from_makegrid_coilfile(cls, coil_file, method="cubic", ignore_groups=False):
         """Create a MixedCoilSet of SplineXYZCoils from a MAKEGRID coil txtfile.
 
         If ignore_groups=False and the MAKEGRID contains more than one coil group
@@ -2649,77 +2775,16 @@ class MixedCoilSet(CoilSet):
 
         """
         coils = {}  # dict of list of SplineXYZCoils, one list per coilgroup
-        coilinds = [2]  # List of line indices where coils are at in the file.
-        # always start at the 3rd line after periods
-        coilnames = []  # the coilgroup each coil belongs to
-        # corresponds to each coil in the coilinds list
         groupnames = []  # this is the groupind + the name of the first coil in
         # the group
-        groupinds = []  # the coilgroup ind each coil belongs to
-        # corresponds to each coil in the coilinds list
         # (sometimes, coils in the same group could have different names,
         # so this separately tracks just the number of the group)
 
-        # read in the coils file
-        headind = -1
-        with open(coil_file) as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines):
-                if line.find("periods") != -1:
-                    headind = i  # skip anything that is above the periods line
-                    coilinds[0] += headind
-                    if len(lines[3 + headind].split()) != 4:
-                        raise OSError(
-                            "4th line in file must be the start of the first coil! "
-                            + "Expected a line of length 4 (after .split()), "
-                            + f"instead got length {lines[3+headind].split()}"
-                        )
-                    header_lines_not_as_expected = np.array(
-                        [
-                            len(lines[0 + headind].split()) != 2,
-                            len(lines[1 + headind].split()) != 2,
-                            len(lines[2 + headind].split()) != 2,
-                        ]
-                    )
-                    if np.any(header_lines_not_as_expected):
-                        wronglines = lines[
-                            np.where(header_lines_not_as_expected)[0] + headind
-                        ]
-                        raise OSError(
-                            "First 3 lines in file starting with the periods line "
-                            + "must be the header lines,"
-                            + " each of length 2 (after .split())! "
-                            + f"Line(s) {wronglines}"
-                            + " are not length 2"
-                        )
-
-                    continue
-                if (
-                    line.find("begin filament") != -1
-                    or line.find("end") != -1
-                    or line.find("mirror") != -1
-                ):
-                    continue  # skip headers and last line
-                if (
-                    len(line.split()) != 4  # find the line immediately before a coil,
-                    # where the line length is greater than 4
-                    and line.strip()  # ensure not counting blank lines
-                    # if we have not found the header yet, skip the line
-                    and headind != -1
-                ):
-                    coilinds.append(i)
-                    groupname = " ".join(line.split()[4:])
-                    groupind = int(groupname.split()[0].strip())
-                    if groupind not in coils.keys():
-                        coils[groupind] = []
-                        groupnames.append(groupname)
-                    coilnames.append(groupname)
-                    groupinds.append(groupind)
-
-        for i, (start, end, groupind, coilname) in enumerate(
-            zip(coilinds[0:-1], coilinds[1:], groupinds, coilnames)
-        ):
-            coords = np.genfromtxt(lines[start + 1 : end])
+        for coords, coilname in zip(*_read_makegrid_coilfile(coil_file)):
+            groupind = int(coilname.split()[0].strip())
+            if groupind not in coils.keys():
+                coils[groupind] = []
+                groupnames.append(coilname)
             coils[groupind].append(
                 SplineXYZCoil(
                     coords[:, -1][0],
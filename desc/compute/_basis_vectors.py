@@ -121,20 +121,18 @@ def _e_sup_rho_rr(params, transforms, profiles, data, **kwargs):
 
     temp_rr = (
         cross(data["e_theta_rr"], data["e_zeta"])
-        + cross(data["e_theta_r"], data["e_zeta_r"])
-        + cross(data["e_theta_r"], data["e_zeta_r"])
+        + 2 * cross(data["e_theta_r"], data["e_zeta_r"])
         + cross(data["e_theta"], data["e_zeta_rr"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^rho_rr"] = (
-        temp_rr.T / data["sqrt(g)"]
+        temp_rr.T * inv_sqrtg
         - (
-            temp_r.T * data["sqrt(g)_r"]
-            + temp_r.T * data["sqrt(g)_r"]
-            + temp.T * data["sqrt(g)_rr"]
+            2 * temp_r.T * data["sqrt(g)_r"] + temp.T * data["sqrt(g)_rr"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_r"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_r"] * inv_sqrtg**3
     ).T
     return data
 
@@ -181,15 +179,16 @@ def _e_sup_rho_rt(params, transforms, profiles, data, **kwargs):
         + cross(data["e_theta"], data["e_zeta_rt"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^rho_rt"] = (
-        temp_rt.T / data["sqrt(g)"]
+        temp_rt.T * inv_sqrtg
         - (
             temp_r.T * data["sqrt(g)_t"]
             + temp_t.T * data["sqrt(g)_r"]
             + temp.T * data["sqrt(g)_rt"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_t"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_t"] * inv_sqrtg**3
     ).T
     return data
 
@@ -236,15 +235,16 @@ def _e_sup_rho_rz(params, transforms, profiles, data, **kwargs):
         + cross(data["e_theta"], data["e_zeta_rz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^rho_rz"] = (
-        temp_rz.T / data["sqrt(g)"]
+        temp_rz.T * inv_sqrtg
         - (
             temp_r.T * data["sqrt(g)_z"]
             + temp_z.T * data["sqrt(g)_r"]
             + temp.T * data["sqrt(g)_rz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -321,20 +321,18 @@ def _e_sup_rho_tt(params, transforms, profiles, data, **kwargs):
 
     temp_tt = (
         cross(data["e_theta_tt"], data["e_zeta"])
-        + cross(data["e_theta_t"], data["e_zeta_t"])
-        + cross(data["e_theta_t"], data["e_zeta_t"])
+        + 2 * cross(data["e_theta_t"], data["e_zeta_t"])
         + cross(data["e_theta"], data["e_zeta_tt"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^rho_tt"] = (
-        temp_tt.T / data["sqrt(g)"]
+        temp_tt.T * inv_sqrtg
         - (
-            temp_t.T * data["sqrt(g)_t"]
-            + temp_t.T * data["sqrt(g)_t"]
-            + temp.T * data["sqrt(g)_tt"]
+            2 * temp_t.T * data["sqrt(g)_t"] + temp.T * data["sqrt(g)_tt"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_t"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_t"] * inv_sqrtg**3
     ).T
     return data
 
@@ -381,15 +379,16 @@ def _e_sup_rho_tz(params, transforms, profiles, data, **kwargs):
         + cross(data["e_theta"], data["e_zeta_tz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^rho_tz"] = (
-        temp_tz.T / data["sqrt(g)"]
+        temp_tz.T * inv_sqrtg
         - (
             temp_t.T * data["sqrt(g)_z"]
             + temp_z.T * data["sqrt(g)_t"]
             + temp.T * data["sqrt(g)_tz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -468,20 +467,18 @@ def _e_sup_rho_zz(params, transforms, profiles, data, **kwargs):
 
     temp_zz = (
         cross(data["e_theta_zz"], data["e_zeta"])
-        + cross(data["e_theta_z"], data["e_zeta_z"])
-        + cross(data["e_theta_z"], data["e_zeta_z"])
+        + 2 * cross(data["e_theta_z"], data["e_zeta_z"])
         + cross(data["e_theta"], data["e_zeta_zz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^rho_zz"] = (
-        temp_zz.T / data["sqrt(g)"]
+        temp_zz.T * inv_sqrtg
         - (
-            temp_z.T * data["sqrt(g)_z"]
-            + temp_z.T * data["sqrt(g)_z"]
-            + temp.T * data["sqrt(g)_zz"]
+            2 * temp_z.T * data["sqrt(g)_z"] + temp.T * data["sqrt(g)_zz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_z"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_z"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -542,15 +539,16 @@ def _e_sup_theta_times_sqrt_g(params, transforms, profiles, data, **kwargs):
     data=["e_zeta", "e_rho", "e_zeta_r", "e_rho_r", "sqrt(g)", "sqrt(g)_r"],
 )
 def _e_sup_theta_r(params, transforms, profiles, data, **kwargs):
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_r"] = (
         (
             cross(data["e_zeta_r"], data["e_rho"])
             + cross(data["e_zeta"], data["e_rho_r"])
         ).T
-        / data["sqrt(g)"]
+        * inv_sqrtg
         - cross(data["e_zeta"], data["e_rho"]).T
         * data["sqrt(g)_r"]
-        / data["sqrt(g)"] ** 2
+        * inv_sqrtg**2
     ).T
     return data
 
@@ -587,20 +585,18 @@ def _e_sup_theta_rr(params, transforms, profiles, data, **kwargs):
 
     temp_rr = (
         cross(data["e_zeta_rr"], data["e_rho"])
-        + cross(data["e_zeta_r"], data["e_rho_r"])
-        + cross(data["e_zeta_r"], data["e_rho_r"])
+        + 2 * cross(data["e_zeta_r"], data["e_rho_r"])
         + cross(data["e_zeta"], data["e_rho_rr"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_rr"] = (
-        temp_rr.T / data["sqrt(g)"]
+        temp_rr.T * inv_sqrtg
         - (
-            temp_r.T * data["sqrt(g)_r"]
-            + temp_r.T * data["sqrt(g)_r"]
-            + temp.T * data["sqrt(g)_rr"]
+            2 * temp_r.T * data["sqrt(g)_r"] + temp.T * data["sqrt(g)_rr"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_r"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_r"] * inv_sqrtg**3
     ).T
     return data
 
@@ -647,15 +643,16 @@ def _e_sup_theta_rt(params, transforms, profiles, data, **kwargs):
         + cross(data["e_zeta"], data["e_rho_rt"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_rt"] = (
-        temp_rt.T / data["sqrt(g)"]
+        temp_rt.T * inv_sqrtg
         - (
             temp_r.T * data["sqrt(g)_t"]
             + temp_t.T * data["sqrt(g)_r"]
             + temp.T * data["sqrt(g)_rt"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_t"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_t"] * inv_sqrtg**3
     ).T
     return data
 
@@ -702,15 +699,16 @@ def _e_sup_theta_rz(params, transforms, profiles, data, **kwargs):
         + cross(data["e_zeta"], data["e_rho_rz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_rz"] = (
-        temp_rz.T / data["sqrt(g)"]
+        temp_rz.T * inv_sqrtg
         - (
             temp_r.T * data["sqrt(g)_z"]
             + temp_z.T * data["sqrt(g)_r"]
             + temp.T * data["sqrt(g)_rz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -730,15 +728,16 @@ def _e_sup_theta_rz(params, transforms, profiles, data, **kwargs):
     data=["e_zeta", "e_rho", "e_zeta_t", "e_rho_t", "sqrt(g)", "sqrt(g)_t"],
 )
 def _e_sup_theta_t(params, transforms, profiles, data, **kwargs):
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_t"] = (
         (
             cross(data["e_zeta_t"], data["e_rho"])
             + cross(data["e_zeta"], data["e_rho_t"])
         ).T
-        / data["sqrt(g)"]
+        * inv_sqrtg
         - cross(data["e_zeta"], data["e_rho"]).T
         * data["sqrt(g)_t"]
-        / data["sqrt(g)"] ** 2
+        * inv_sqrtg**2
     ).T
     return data
 
@@ -775,20 +774,18 @@ def _e_sup_theta_tt(params, transforms, profiles, data, **kwargs):
 
     temp_tt = (
         cross(data["e_zeta_tt"], data["e_rho"])
-        + cross(data["e_zeta_t"], data["e_rho_t"])
-        + cross(data["e_zeta_t"], data["e_rho_t"])
+        + 2 * cross(data["e_zeta_t"], data["e_rho_t"])
         + cross(data["e_zeta"], data["e_rho_tt"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_tt"] = (
-        temp_tt.T / data["sqrt(g)"]
+        temp_tt.T * inv_sqrtg
         - (
-            temp_t.T * data["sqrt(g)_t"]
-            + temp_t.T * data["sqrt(g)_t"]
-            + temp.T * data["sqrt(g)_tt"]
+            2 * temp_t.T * data["sqrt(g)_t"] + temp.T * data["sqrt(g)_tt"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_t"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_t"] * inv_sqrtg**3
     ).T
     return data
 
@@ -835,15 +832,16 @@ def _e_sup_theta_tz(params, transforms, profiles, data, **kwargs):
         + cross(data["e_zeta"], data["e_rho_tz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_tz"] = (
-        temp_tz.T / data["sqrt(g)"]
+        temp_tz.T * inv_sqrtg
         - (
             temp_t.T * data["sqrt(g)_z"]
             + temp_z.T * data["sqrt(g)_t"]
             + temp.T * data["sqrt(g)_tz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -863,15 +861,16 @@ def _e_sup_theta_tz(params, transforms, profiles, data, **kwargs):
     data=["e_zeta", "e_rho", "e_zeta_z", "e_rho_z", "sqrt(g)", "sqrt(g)_z"],
 )
 def _e_sup_theta_z(params, transforms, profiles, data, **kwargs):
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_z"] = (
         (
             cross(data["e_zeta_z"], data["e_rho"])
             + cross(data["e_zeta"], data["e_rho_z"])
         ).T
-        / data["sqrt(g)"]
+        * inv_sqrtg
         - cross(data["e_zeta"], data["e_rho"]).T
         * data["sqrt(g)_z"]
-        / data["sqrt(g)"] ** 2
+        * inv_sqrtg**2
     ).T
     return data
 
@@ -908,20 +907,18 @@ def _e_sup_theta_zz(params, transforms, profiles, data, **kwargs):
 
     temp_zz = (
         cross(data["e_zeta_zz"], data["e_rho"])
-        + cross(data["e_zeta_z"], data["e_rho_z"])
-        + cross(data["e_zeta_z"], data["e_rho_z"])
+        + 2 * cross(data["e_zeta_z"], data["e_rho_z"])
         + cross(data["e_zeta"], data["e_rho_zz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^theta_zz"] = (
-        temp_zz.T / data["sqrt(g)"]
+        temp_zz.T * inv_sqrtg
         - (
-            temp_z.T * data["sqrt(g)_z"]
-            + temp_z.T * data["sqrt(g)_z"]
-            + temp.T * data["sqrt(g)_zz"]
+            2 * temp_z.T * data["sqrt(g)_z"] + temp.T * data["sqrt(g)_zz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_z"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_z"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -1014,20 +1011,18 @@ def _e_sup_zeta_rr(params, transforms, profiles, data, **kwargs):
 
     temp_rr = (
         cross(data["e_rho_rr"], data["e_theta"])
-        + cross(data["e_rho_r"], data["e_theta_r"])
-        + cross(data["e_rho_r"], data["e_theta_r"])
+        + 2 * cross(data["e_rho_r"], data["e_theta_r"])
         + cross(data["e_rho"], data["e_theta_rr"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^zeta_rr"] = (
-        temp_rr.T / data["sqrt(g)"]
+        temp_rr.T * inv_sqrtg
         - (
-            temp_r.T * data["sqrt(g)_r"]
-            + temp_r.T * data["sqrt(g)_r"]
-            + temp.T * data["sqrt(g)_rr"]
+            2 * temp_r.T * data["sqrt(g)_r"] + temp.T * data["sqrt(g)_rr"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_r"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_r"] * inv_sqrtg**3
     ).T
     return data
 
@@ -1074,15 +1069,16 @@ def _e_sup_zeta_rt(params, transforms, profiles, data, **kwargs):
         + cross(data["e_rho"], data["e_theta_rt"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^zeta_rt"] = (
-        temp_rt.T / data["sqrt(g)"]
+        temp_rt.T * inv_sqrtg
         - (
             temp_r.T * data["sqrt(g)_t"]
             + temp_t.T * data["sqrt(g)_r"]
             + temp.T * data["sqrt(g)_rt"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_t"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_t"] * inv_sqrtg**3
     ).T
     return data
 
@@ -1129,15 +1125,16 @@ def _e_sup_zeta_rz(params, transforms, profiles, data, **kwargs):
         + cross(data["e_rho"], data["e_theta_rz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^zeta_rz"] = (
-        temp_rz.T / data["sqrt(g)"]
+        temp_rz.T * inv_sqrtg
         - (
             temp_r.T * data["sqrt(g)_z"]
             + temp_z.T * data["sqrt(g)_r"]
             + temp.T * data["sqrt(g)_rz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_r"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -1217,20 +1214,18 @@ def _e_sup_zeta_tt(params, transforms, profiles, data, **kwargs):
 
     temp_tt = (
         cross(data["e_rho_tt"], data["e_theta"])
-        + cross(data["e_rho_t"], data["e_theta_t"])
-        + cross(data["e_rho_t"], data["e_theta_t"])
+        + 2 * cross(data["e_rho_t"], data["e_theta_t"])
         + cross(data["e_rho"], data["e_theta_tt"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^zeta_tt"] = (
-        temp_tt.T / data["sqrt(g)"]
+        temp_tt.T * inv_sqrtg
         - (
-            temp_t.T * data["sqrt(g)_t"]
-            + temp_t.T * data["sqrt(g)_t"]
-            + temp.T * data["sqrt(g)_tt"]
+            2 * temp_t.T * data["sqrt(g)_t"] + temp.T * data["sqrt(g)_tt"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_t"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_t"] * inv_sqrtg**3
     ).T
     return data
 
@@ -1277,15 +1272,16 @@ def _e_sup_zeta_tz(params, transforms, profiles, data, **kwargs):
         + cross(data["e_rho"], data["e_theta_tz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^zeta_tz"] = (
-        temp_tz.T / data["sqrt(g)"]
+        temp_tz.T * inv_sqrtg
         - (
             temp_t.T * data["sqrt(g)_z"]
             + temp_z.T * data["sqrt(g)_t"]
             + temp.T * data["sqrt(g)_tz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_t"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -1365,20 +1361,18 @@ def _e_sup_zeta_zz(params, transforms, profiles, data, **kwargs):
 
     temp_zz = (
         cross(data["e_rho_zz"], data["e_theta"])
-        + cross(data["e_rho_z"], data["e_theta_z"])
-        + cross(data["e_rho_z"], data["e_theta_z"])
+        + 2 * cross(data["e_rho_z"], data["e_theta_z"])
         + cross(data["e_rho"], data["e_theta_zz"])
     )
 
+    inv_sqrtg = 1 / data["sqrt(g)"]
     data["e^zeta_zz"] = (
-        temp_zz.T / data["sqrt(g)"]
+        temp_zz.T * inv_sqrtg
         - (
-            temp_z.T * data["sqrt(g)_z"]
-            + temp_z.T * data["sqrt(g)_z"]
-            + temp.T * data["sqrt(g)_zz"]
+            2 * temp_z.T * data["sqrt(g)_z"] + temp.T * data["sqrt(g)_zz"]
         )
-        / data["sqrt(g)"] ** 2
-        + 2 * temp.T * data["sqrt(g)_z"] * data["sqrt(g)_z"] / data["sqrt(g)"] ** 3
+        * inv_sqrtg**2
+        + 2 * temp.T * data["sqrt(g)_z"] * data["sqrt(g)_z"] * inv_sqrtg**3
     ).T
     return data
 
@@ -1430,7 +1424,9 @@ def _e_sub_phi_rt(params, transforms, profiles, data, **kwargs):
 def _e_sub_rho(params, transforms, profiles, data, **kwargs):
     # At the magnetic axis, this function returns the multivalued map whose
     # image is the set { 𝐞ᵨ | ρ=0 }.
-    data["e_rho"] = jnp.array([data["R_r"], data["R"] * data["omega_r"], data["Z_r"]]).T
+    data["e_rho"] = jnp.stack(
+        [data["R_r"], data["R"] * data["omega_r"], data["Z_r"]], axis=-1
+    )
     return data
 
 
@@ -1455,13 +1451,14 @@ def _e_sub_rho_r(params, transforms, profiles, data, **kwargs):
     # e_rho_r = a^i e_i, where the a^i are the components specified below and the
     # e_i are the basis vectors of the polar lab frame. omega_r e_2, -omega_r e_1,
     # 0 are the derivatives with respect to rho of e_1, e_2, e_3, respectively.
-    data["e_rho_r"] = jnp.array(
+    data["e_rho_r"] = jnp.stack(
         [
             -data["R"] * data["omega_r"] ** 2 + data["R_rr"],
             2 * data["R_r"] * data["omega_r"] + data["R"] * data["omega_rr"],
             data["Z_rr"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -1496,7 +1493,7 @@ def _e_sub_rho_r(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_rho_rr(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rr"] = jnp.array(
+    data["e_rho_rr"] = jnp.stack(
         [
             -3 * data["R_r"] * data["omega_r"] ** 2
             - 3 * data["R"] * data["omega_r"] * data["omega_rr"]
@@ -1504,8 +1501,9 @@ def _e_sub_rho_rr(params, transforms, profiles, data, **kwargs):
             3 * (data["omega_r"] * data["R_rr"] + data["R_r"] * data["omega_rr"])
             + data["R"] * (-data["omega_r"] ** 3 + data["omega_rrr"]),
             data["Z_rrr"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -1541,7 +1539,7 @@ def _e_sub_rho_rr(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_rho_rrr(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rrr"] = jnp.array(
+    data["e_rho_rrr"] = jnp.stack(
         [
             -6 * data["R_rr"] * data["omega_r"] ** 2
             - 12 * data["R_r"] * data["omega_r"] * data["omega_rr"]
@@ -1558,8 +1556,9 @@ def _e_sub_rho_rrr(params, transforms, profiles, data, **kwargs):
             + data["R_r"]
             * (data["omega_rrrr"] - 6 * data["omega_r"] ** 2 * data["omega_rr"]),
             data["Z_rrrr"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -1603,7 +1602,7 @@ def _e_sub_rho_rrr(params, transforms, profiles, data, **kwargs):
     aliases=["e_theta_rrr"],
 )
 def _e_sub_rho_rrt(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rrt"] = jnp.array(
+    data["e_rho_rrt"] = jnp.stack(
         [
             -3 * data["R_rt"] * data["omega_r"] ** 2
             - 3 * data["R_t"] * data["omega_r"] * data["omega_rr"]
@@ -1639,8 +1638,9 @@ def _e_sub_rho_rrt(params, transforms, profiles, data, **kwargs):
             )
             - data["R_t"] * data["omega_r"] ** 3,
             data["Z_rrrt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -1680,7 +1680,7 @@ def _e_sub_rho_rrt(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_rrr"],
 )
 def _e_sub_rho_rrz(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rrz"] = jnp.array(
+    data["e_rho_rrz"] = jnp.stack(
         [
             -3 * data["R"] * data["omega_rrz"] * data["omega_r"]
             - 3
@@ -1720,8 +1720,9 @@ def _e_sub_rho_rrz(params, transforms, profiles, data, **kwargs):
             + 3 * data["R_rz"] * data["omega_rr"]
             + data["R_z"] * (data["omega_rrr"] - data["omega_r"] ** 3),
             data["Z_rrrz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -1761,7 +1762,7 @@ def _e_sub_rho_rrz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_rho_rt(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rt"] = jnp.array(
+    data["e_rho_rt"] = jnp.stack(
         [
             -data["R_t"] * data["omega_r"] ** 2
             - 2 * data["R"] * data["omega_r"] * data["omega_rt"]
@@ -1774,8 +1775,9 @@ def _e_sub_rho_rt(params, transforms, profiles, data, **kwargs):
             + data["R_t"] * data["omega_rr"]
             + data["R"] * (-data["omega_t"] * data["omega_r"] ** 2 + data["omega_rrt"]),
             data["Z_rrt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -1821,7 +1823,7 @@ def _e_sub_rho_rt(params, transforms, profiles, data, **kwargs):
     aliases=["e_theta_rrt"],
 )
 def _e_sub_rho_rtt(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rtt"] = jnp.array(
+    data["e_rho_rtt"] = jnp.stack(
         [
             -data["R_rr"] * data["omega_t"] ** 2
             - 4 * data["R_rt"] * data["omega_r"] * data["omega_t"]
@@ -1856,8 +1858,9 @@ def _e_sub_rho_rtt(params, transforms, profiles, data, **kwargs):
             + data["R"]
             * (data["omega_rrtt"] - data["omega_tt"] * data["omega_r"] ** 2),
             data["Z_rrtt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -1905,7 +1908,7 @@ def _e_sub_rho_rtt(params, transforms, profiles, data, **kwargs):
     aliases=["e_theta_rrz", "e_zeta_rrt"],
 )
 def _e_sub_rho_rtz(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rtz"] = jnp.array(
+    data["e_rho_rtz"] = jnp.stack(
         [
             -data["omega_rz"] * data["R_t"] * data["omega_r"]
             - (1 + data["omega_z"])
@@ -1993,8 +1996,9 @@ def _e_sub_rho_rtz(params, transforms, profiles, data, **kwargs):
                 + data["R_rtz"]
             ),
             data["Z_rrtz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2030,7 +2034,7 @@ def _e_sub_rho_rtz(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_rr"],
 )
 def _e_sub_rho_rz(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rz"] = jnp.array(
+    data["e_rho_rz"] = jnp.stack(
         [
             -2 * (1 + data["omega_z"]) * data["R_r"] * data["omega_r"]
             - data["R_z"] * data["omega_r"] ** 2
@@ -2044,8 +2048,9 @@ def _e_sub_rho_rz(params, transforms, profiles, data, **kwargs):
             - data["R"]
             * ((1 + data["omega_z"]) * data["omega_r"] ** 2 - data["omega_rrz"]),
             data["Z_rrz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2087,7 +2092,7 @@ def _e_sub_rho_rz(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_rrz"],
 )
 def _e_sub_rho_rzz(params, transforms, profiles, data, **kwargs):
-    data["e_rho_rzz"] = jnp.array(
+    data["e_rho_rzz"] = jnp.stack(
         [
             -2 * (1 + data["omega_z"]) * data["omega_rz"] * data["R_r"]
             - (1 + data["omega_z"]) ** 2 * data["R_rr"]
@@ -2143,8 +2148,9 @@ def _e_sub_rho_rzz(params, transforms, profiles, data, **kwargs):
                 + data["R_rzz"]
             ),
             data["Z_rrzz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2170,15 +2176,16 @@ def _e_sub_rho_rzz(params, transforms, profiles, data, **kwargs):
 def _e_sub_rho_t(params, transforms, profiles, data, **kwargs):
     # At the magnetic axis, this function returns the multivalued map whose
     # image is the set { ∂ᵨ 𝐞_θ | ρ=0 }
-    data["e_rho_t"] = jnp.array(
+    data["e_rho_t"] = jnp.stack(
         [
             -data["R"] * data["omega_t"] * data["omega_r"] + data["R_rt"],
             data["omega_t"] * data["R_r"]
             + data["R_t"] * data["omega_r"]
             + data["R"] * data["omega_rt"],
             data["Z_rt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2218,7 +2225,7 @@ def _e_sub_rho_t(params, transforms, profiles, data, **kwargs):
     aliases=["e_theta_rt"],
 )
 def _e_sub_rho_tt(params, transforms, profiles, data, **kwargs):
-    data["e_rho_tt"] = jnp.array(
+    data["e_rho_tt"] = jnp.stack(
         [
             -data["omega_t"] ** 2 * data["R_r"]
             - data["R"] * data["omega_tt"] * data["omega_r"]
@@ -2232,8 +2239,9 @@ def _e_sub_rho_tt(params, transforms, profiles, data, **kwargs):
             + 2 * data["R_t"] * data["omega_rt"]
             + data["R"] * (-data["omega_t"] ** 2 * data["omega_r"] + data["omega_rtt"]),
             data["Z_rtt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2273,7 +2281,7 @@ def _e_sub_rho_tt(params, transforms, profiles, data, **kwargs):
     aliases=["e_theta_rz", "e_zeta_rt"],
 )
 def _e_sub_rho_tz(params, transforms, profiles, data, **kwargs):
-    data["e_rho_tz"] = jnp.array(
+    data["e_rho_tz"] = jnp.stack(
         [
             -((1 + data["omega_z"]) * data["R_t"] * data["omega_r"])
             - data["R"] * data["omega_tz"] * data["omega_r"]
@@ -2297,8 +2305,9 @@ def _e_sub_rho_tz(params, transforms, profiles, data, **kwargs):
                 + data["omega_rtz"]
             ),
             data["Z_rtz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2318,15 +2327,16 @@ def _e_sub_rho_tz(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_r"],
 )
 def _e_sub_rho_z(params, transforms, profiles, data, **kwargs):
-    data["e_rho_z"] = jnp.array(
+    data["e_rho_z"] = jnp.stack(
         [
             -data["R"] * (1 + data["omega_z"]) * data["omega_r"] + data["R_rz"],
             (1 + data["omega_z"]) * data["R_r"]
             + data["R_z"] * data["omega_r"]
             + data["R"] * data["omega_rz"],
             data["Z_rz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2362,7 +2372,7 @@ def _e_sub_rho_z(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_rz"],
 )
 def _e_sub_rho_zz(params, transforms, profiles, data, **kwargs):
-    data["e_rho_zz"] = jnp.array(
+    data["e_rho_zz"] = jnp.stack(
         [
             -((1 + data["omega_z"]) ** 2) * data["R_r"]
             - 2 * data["R_z"] * (1 + data["omega_z"]) * data["omega_r"]
@@ -2376,8 +2386,9 @@ def _e_sub_rho_zz(params, transforms, profiles, data, **kwargs):
             - data["R"]
             * ((1 + data["omega_z"]) ** 2 * data["omega_r"] - data["omega_rzz"]),
             data["Z_rzz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2400,9 +2411,9 @@ def _e_sub_rho_zz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_theta(params, transforms, profiles, data, **kwargs):
-    data["e_theta"] = jnp.array(
-        [data["R_t"], data["R"] * data["omega_t"], data["Z_t"]]
-    ).T
+    data["e_theta"] = jnp.stack(
+        [data["R_t"], data["R"] * data["omega_t"], data["Z_t"]], axis=-1
+    )
 
     return data
 
@@ -2545,7 +2556,7 @@ def _e_sub_rho_vp(params, transforms, profiles, data, **kwargs):
     aliases=["e_rho_ttt"],
 )
 def _e_sub_theta_rtt(params, transforms, profiles, data, **kwargs):
-    data["e_theta_rtt"] = jnp.array(
+    data["e_theta_rtt"] = jnp.stack(
         [
             -3 * data["R_rt"] * data["omega_t"] ** 2
             - 3
@@ -2582,8 +2593,9 @@ def _e_sub_theta_rtt(params, transforms, profiles, data, **kwargs):
             + data["R"]
             * (data["omega_rttt"] - 3 * data["omega_t"] ** 2 * data["omega_rt"]),
             data["Z_rttt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2631,7 +2643,7 @@ def _e_sub_theta_rtt(params, transforms, profiles, data, **kwargs):
     aliases=["e_rho_ttz", "e_zeta_rtt"],
 )
 def _e_sub_theta_rtz(params, transforms, profiles, data, **kwargs):
-    data["e_theta_rtz"] = jnp.array(
+    data["e_theta_rtz"] = jnp.stack(
         [
             -2 * data["omega_rz"] * data["R_t"] * data["omega_t"]
             - 2
@@ -2687,8 +2699,9 @@ def _e_sub_theta_rtz(params, transforms, profiles, data, **kwargs):
                 + data["R_ttz"]
             ),
             data["Z_rttz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2736,7 +2749,7 @@ def _e_sub_theta_rtz(params, transforms, profiles, data, **kwargs):
     aliases=["e_rho_tzz", "e_zeta_rtz"],
 )
 def _e_sub_theta_rzz(params, transforms, profiles, data, **kwargs):
-    data["e_theta_rzz"] = jnp.array(
+    data["e_theta_rzz"] = jnp.stack(
         [
             -2 * (1 + data["omega_z"]) * data["omega_rz"] * data["R_t"]
             - (1 + data["omega_z"]) ** 2 * data["R_rt"]
@@ -2795,8 +2808,9 @@ def _e_sub_theta_rzz(params, transforms, profiles, data, **kwargs):
                 + data["R_tzz"]
             ),
             data["Z_rtzz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2819,13 +2833,14 @@ def _e_sub_theta_rzz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_theta_t(params, transforms, profiles, data, **kwargs):
-    data["e_theta_t"] = jnp.array(
+    data["e_theta_t"] = jnp.stack(
         [
             -data["R"] * data["omega_t"] ** 2 + data["R_tt"],
             2 * data["R_t"] * data["omega_t"] + data["R"] * data["omega_tt"],
             data["Z_tt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
     return data
 
 
@@ -2859,7 +2874,7 @@ def _e_sub_theta_t(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_theta_tt(params, transforms, profiles, data, **kwargs):
-    data["e_theta_tt"] = jnp.array(
+    data["e_theta_tt"] = jnp.stack(
         [
             -3 * data["R_t"] * data["omega_t"] ** 2
             - 3 * data["R"] * data["omega_t"] * data["omega_tt"]
@@ -2867,8 +2882,9 @@ def _e_sub_theta_tt(params, transforms, profiles, data, **kwargs):
             3 * (data["omega_t"] * data["R_tt"] + data["R_t"] * data["omega_tt"])
             + data["R"] * (-data["omega_t"] ** 3 + data["omega_ttt"]),
             data["Z_ttt"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2908,7 +2924,7 @@ def _e_sub_theta_tt(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_tt"],
 )
 def _e_sub_theta_tz(params, transforms, profiles, data, **kwargs):
-    data["e_theta_tz"] = jnp.array(
+    data["e_theta_tz"] = jnp.stack(
         [
             -2 * (1 + data["omega_z"]) * data["R_t"] * data["omega_t"]
             - data["R_z"] * data["omega_t"] ** 2
@@ -2922,8 +2938,9 @@ def _e_sub_theta_tz(params, transforms, profiles, data, **kwargs):
             - data["R"]
             * ((1 + data["omega_z"]) * data["omega_t"] ** 2 - data["omega_ttz"]),
             data["Z_ttz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2947,15 +2964,16 @@ def _e_sub_theta_tz(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_t"],
 )
 def _e_sub_theta_z(params, transforms, profiles, data, **kwargs):
-    data["e_theta_z"] = jnp.array(
+    data["e_theta_z"] = jnp.stack(
         [
             -data["R"] * (1 + data["omega_z"]) * data["omega_t"] + data["R_tz"],
             (1 + data["omega_z"]) * data["R_t"]
             + data["R_z"] * data["omega_t"]
             + data["R"] * data["omega_tz"],
             data["Z_tz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -2995,7 +3013,7 @@ def _e_sub_theta_z(params, transforms, profiles, data, **kwargs):
     aliases=["e_zeta_tz"],
 )
 def _e_sub_theta_zz(params, transforms, profiles, data, **kwargs):
-    data["e_theta_zz"] = jnp.array(
+    data["e_theta_zz"] = jnp.stack(
         [
             -((1 + data["omega_z"]) ** 2) * data["R_t"]
             - 2 * data["R_z"] * (1 + data["omega_z"]) * data["omega_t"]
@@ -3009,8 +3027,9 @@ def _e_sub_theta_zz(params, transforms, profiles, data, **kwargs):
             - data["R"]
             * ((1 + data["omega_z"]) ** 2 * data["omega_t"] - data["omega_tzz"]),
             data["Z_tzz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -3033,9 +3052,9 @@ def _e_sub_theta_zz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_zeta(params, transforms, profiles, data, **kwargs):
-    data["e_zeta"] = jnp.array(
-        [data["R_z"], data["R"] * (1 + data["omega_z"]), data["Z_z"]]
-    ).T
+    data["e_zeta"] = jnp.stack(
+        [data["R_z"], data["R"] * (1 + data["omega_z"]), data["Z_z"]], axis=-1
+    )
 
     return data
 
@@ -3074,7 +3093,7 @@ def _e_sub_zeta(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_zeta_rzz(params, transforms, profiles, data, **kwargs):
-    data["e_zeta_rzz"] = jnp.array(
+    data["e_zeta_rzz"] = jnp.stack(
         [
             -3 * data["R_rz"] * (1 + data["omega_z"]) ** 2
             - 6 * data["R_z"] * (1 + data["omega_z"]) * data["omega_rz"]
@@ -3123,8 +3142,9 @@ def _e_sub_zeta_rzz(params, transforms, profiles, data, **kwargs):
                 + data["R_zzz"]
             ),
             data["Z_rzzz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -3147,13 +3167,14 @@ def _e_sub_zeta_rzz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_zeta_z(params, transforms, profiles, data, **kwargs):
-    data["e_zeta_z"] = jnp.array(
+    data["e_zeta_z"] = jnp.stack(
         [
             -data["R"] * (1 + data["omega_z"]) ** 2 + data["R_zz"],
             2 * data["R_z"] * (1 + data["omega_z"]) + data["R"] * data["omega_zz"],
             data["Z_zz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -3188,7 +3209,7 @@ def _e_sub_zeta_z(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _e_sub_zeta_zz(params, transforms, profiles, data, **kwargs):
-    data["e_zeta_zz"] = jnp.array(
+    data["e_zeta_zz"] = jnp.stack(
         [
             -3 * data["R_z"] * (1 + data["omega_z"]) ** 2
             - 3 * data["R"] * (1 + data["omega_z"]) * data["omega_zz"]
@@ -3204,8 +3225,9 @@ def _e_sub_zeta_zz(params, transforms, profiles, data, **kwargs):
                 - data["omega_zzz"]
             ),
             data["Z_zzz"],
-        ]
-    ).T
+        ],
+        axis=-1,
+    )
 
     return data
 
@@ -202,16 +202,15 @@ def _x_FourierPlanarCurve(params, transforms, profiles, data, **kwargs):
         normal = params["normal"]
     # create planar curve at Z==0
     r = transforms["r"].transform(params["r_n"], dz=0)
-    Z = jnp.zeros_like(r)
     X = r * jnp.cos(data["s"])
     Y = r * jnp.sin(data["s"])
-    coords = jnp.array([X, Y, Z]).T
     # rotate into place
     Zaxis = jnp.array([0.0, 0.0, 1.0])  # 2D curve in X-Y plane has normal = +Z axis
     axis = cross(Zaxis, normal)
     angle = jnp.arccos(dot(Zaxis, safenormalize(normal)))
     A = rotation_matrix(axis=axis, angle=angle)
-    coords = jnp.matmul(coords, A.T) + center
+    # the curve has no Z component, so only the first two columns of A contribute
+    coords = jnp.stack([X, Y], axis=-1) @ A[:, :2].T + center
     coords = jnp.matmul(coords, params["rotmat"].reshape((3, 3)).T) + params["shift"]
     # convert back to rpz
     coords = xyz2rpz(coords)
@@ -244,14 +243,12 @@ def _x_s_FourierPlanarCurve(params, transforms, profiles, data, **kwargs):
     dr = transforms["r"].transform(params["r_n"], dz=1)
     dX = dr * jnp.cos(data["s"]) - r * jnp.sin(data["s"])
     dY = dr * jnp.sin(data["s"]) + r * jnp.cos(data["s"])
-    dZ = jnp.zeros_like(dX)
-    coords = jnp.array([dX, dY, dZ]).T
     # rotate into place
     Zaxis = jnp.array([0.0, 0.0, 1.0])  # 2D curve in X-Y plane has normal = +Z axis
     axis = cross(Zaxis, normal)
     angle = jnp.arccos(dot(Zaxis, safenormalize(normal)))
     A = rotation_matrix(axis=axis, angle=angle)
-    coords = jnp.matmul(coords, A.T)
+    coords = jnp.stack([dX, dY], axis=-1) @ A[:, :2].T
     coords = jnp.matmul(coords, params["rotmat"].reshape((3, 3)).T)
     # convert back to rpz
     coords = xyz2rpz_vec(coords, phi=data["phi"])
@@ -289,14 +286,12 @@ def _x_ss_FourierPlanarCurve(params, transforms, profiles, data, **kwargs):
     d2Y = (
         d2r * jnp.sin(data["s"]) + 2 * dr * jnp.cos(data["s"]) - r * jnp.sin(data["s"])
     )
-    d2Z = jnp.zeros_like(d2X)
-    coords = jnp.array([d2X, d2Y, d2Z]).T
     # rotate into place
     Zaxis = jnp.array([0.0, 0.0, 1.0])  # 2D curve in X-Y plane has normal = +Z axis
     axis = cross(Zaxis, normal)
     angle = jnp.arccos(dot(Zaxis, safenormalize(normal)))
     A = rotation_matrix(axis=axis, angle=angle)
-    coords = jnp.matmul(coords, A.T)
+    coords = jnp.stack([d2X, d2Y], axis=-1) @ A[:, :2].T
     coords = jnp.matmul(coords, params["rotmat"].reshape((3, 3)).T)
     # convert back to rpz
     coords = xyz2rpz_vec(coords, phi=data["phi"])
@@ -341,14 +336,12 @@ def _x_sss_FourierPlanarCurve(params, transforms, profiles, data, **kwargs):
         - 3 * dr * jnp.sin(data["s"])
         - r * jnp.cos(data["s"])
     )
-    d3Z = jnp.zeros_like(d3X)
-    coords = jnp.array([d3X, d3Y, d3Z]).T
     # rotate into place
     Zaxis = jnp.array([0.0, 0.0, 1.0])  # 2D curve in X-Y plane has normal = +Z axis
     axis = cross(Zaxis, normal)
     angle = jnp.arccos(dot(Zaxis, safenormalize(normal)))
     A = rotation_matrix(axis=axis, angle=angle)
-    coords = jnp.matmul(coords, A.T)
+    coords = jnp.stack([d3X, d3Y], axis=-1) @ A[:, :2].T
     coords = jnp.matmul(coords, params["rotmat"].reshape((3, 3)).T)
     # convert back to rpz
     coords = xyz2rpz_vec(coords, phi=data["phi"])
@@ -665,8 +658,9 @@ def _x_sss_FourierXYZCurve(params, transforms, profiles, data, **kwargs):
 )
 def _center_SplineXYZCurve(params, transforms, profiles, data, **kwargs):
     # center is average of xyz knots
-    xyz = jnp.stack([params["X"], params["Y"], params["Z"]], axis=1)
-    center = jnp.mean(xyz, axis=0)
+    center = jnp.array(
+        [jnp.mean(params["X"]), jnp.mean(params["Y"]), jnp.mean(params["Z"])]
+    )
     # displacement and rotation
     center = jnp.matmul(center, params["rotmat"].reshape((3, 3)).T) + params["shift"]
     # convert to rpz
@@ -135,10 +135,10 @@ def _J_sup_zeta(params, transforms, profiles, data, **kwargs):
 )
 def _J(params, transforms, profiles, data, **kwargs):
     data["J"] = (
-        data["J^rho"] * data["e_rho"].T
-        + data["J^theta*sqrt(g)"] * data["e_theta/sqrt(g)"].T
-        + data["J^zeta"] * data["e_zeta"].T
-    ).T
+        data["J^rho"][:, None] * data["e_rho"]
+        + data["J^theta*sqrt(g)"][:, None] * data["e_theta/sqrt(g)"]
+        + data["J^zeta"][:, None] * data["e_zeta"]
+    )
     return data
 
 
@@ -167,10 +167,10 @@ def _J(params, transforms, profiles, data, **kwargs):
 )
 def _J_sqrt_g(params, transforms, profiles, data, **kwargs):
     data["J*sqrt(g)"] = (
-        (data["B_zeta_t"] - data["B_theta_z"]) * data["e_rho"].T
-        + (data["B_rho_z"] - data["B_zeta_r"]) * data["e_theta"].T
-        + (data["B_theta_r"] - data["B_rho_t"]) * data["e_zeta"].T
-    ).T / mu_0
+        (data["B_zeta_t"] - data["B_theta_z"])[:, None] * data["e_rho"]
+        + (data["B_rho_z"] - data["B_zeta_r"])[:, None] * data["e_theta"]
+        + (data["B_theta_r"] - data["B_rho_t"])[:, None] * data["e_zeta"]
+    ) / mu_0
     return data
 
 
@@ -209,13 +209,13 @@ def _J_sqrt_g(params, transforms, profiles, data, **kwargs):
 )
 def _J_sqrt_g_r(params, transforms, profiles, data, **kwargs):
     data["(J*sqrt(g))_r"] = (
-        (data["B_zeta_rt"] - data["B_theta_rz"]) * data["e_rho"].T
-        + (data["B_zeta_t"] - data["B_theta_z"]) * data["e_rho_r"].T
-        + (data["B_rho_rz"] - data["B_zeta_rr"]) * data["e_theta"].T
-        + (data["B_rho_z"] - data["B_zeta_r"]) * data["e_theta_r"].T
-        + (data["B_theta_rr"] - data["B_rho_rt"]) * data["e_zeta"].T
-        + (data["B_theta_r"] - data["B_rho_t"]) * data["e_zeta_r"].T
-    ).T / mu_0
+        (data["B_zeta_rt"] - data["B_theta_rz"])[:, None] * data["e_rho"]
+        + (data["B_zeta_t"] - data["B_theta_z"])[:, None] * data["e_rho_r"]
+        + (data["B_rho_rz"] - data["B_zeta_rr"])[:, None] * data["e_theta"]
+        + (data["B_rho_z"] - data["B_zeta_r"])[:, None] * data["e_theta_r"]
+        + (data["B_theta_rr"] - data["B_rho_rt"])[:, None] * data["e_zeta"]
+        + (data["B_theta_r"] - data["B_rho_t"])[:, None] * data["e_zeta_r"]
+    ) / mu_0
     return data
 
 
@@ -500,10 +500,10 @@ def _F_helical(params, transforms, profiles, data, **kwargs):
 def _F(params, transforms, profiles, data, **kwargs):
     # F_theta e^theta refactored as below to resolve indeterminacy at axis.
     data["F"] = (
-        data["F_rho"] * data["e^rho"].T
-        - data["B^zeta"] * data["J^rho"] * data["e^theta*sqrt(g)"].T
-        + data["F_zeta"] * data["e^zeta"].T
-    ).T
+        data["F_rho"][:, None] * data["e^rho"]
+        - (data["B^zeta"] * data["J^rho"])[:, None] * data["e^theta*sqrt(g)"]
+        + data["F_zeta"][:, None] * data["e^zeta"]
+    )
     return data
 
 
@@ -561,8 +561,9 @@ def _Fmag_vol(params, transforms, profiles, data, **kwargs):
 )
 def _e_sup_helical(params, transforms, profiles, data, **kwargs):
     data["e^helical"] = (
-        data["B^zeta"] * data["e^theta"].T - data["B^theta"] * data["e^zeta"].T
-    ).T
+        data["B^zeta"][:, None] * data["e^theta"]
+        - data["B^theta"][:, None] * data["e^zeta"]
+    )
     return data
 
 
@@ -581,9 +582,9 @@ def _e_sup_helical(params, transforms, profiles, data, **kwargs):
 )
 def _e_sup_helical_times_sqrt_g(params, transforms, profiles, data, **kwargs):
     data["e^helical*sqrt(g)"] = (
-        data["B^zeta"] * data["e^theta*sqrt(g)"].T
-        - (data["sqrt(g)"] * data["B^theta"]) * data["e^zeta"].T
-    ).T
+        data["B^zeta"][:, None] * data["e^theta*sqrt(g)"]
+        - (data["sqrt(g)"] * data["B^theta"])[:, None] * data["e^zeta"]
+    )
     return data
 
 
@@ -638,11 +639,11 @@ def _e_sup_helical_times_sqrt_g_mag(params, transforms, profiles, data, **kwargs
 )
 def _F_anisotropic(params, transforms, profiles, data, **kwargs):
     data["F_anisotropic"] = (
-        (1 - data["beta_a"]) * cross(data["J"], data["B"]).T
-        - dot(data["B"], data["grad(beta_a)"]) * data["B"].T / mu_0
-        - data["beta_a"] * data["grad(|B|^2)"].T / (2 * mu_0)
-        - data["grad(p)"].T
-    ).T
+        (1 - data["beta_a"])[:, None] * cross(data["J"], data["B"])
+        - (dot(data["B"], data["grad(beta_a)"]) / mu_0)[:, None] * data["B"]
+        - (data["beta_a"] / (2 * mu_0))[:, None] * data["grad(|B|^2)"]
+        - data["grad(p)"]
+    )
 
     return data
 
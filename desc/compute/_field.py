@@ -20,7 +20,7 @@ from ..integrals.surface_integral import (
     surface_min,
 )
 from .data_index import register_compute_fun
-from .utils import cross, dot, safediv, safenorm
+from .utils import cross, dot, safediv, safenorm, triple
 
 
 @register_compute_fun(
@@ -120,8 +120,9 @@ def _B_sup_zeta(params, transforms, profiles, data, **kwargs):
 )
 def _B(params, transforms, profiles, data, **kwargs):
     data["B"] = (
-        data["B^theta"] * data["e_theta"].T + data["B^zeta"] * data["e_zeta"].T
-    ).T
+        data["B^theta"][:, None] * data["e_theta"]
+        + data["B^zeta"][:, None] * data["e_zeta"]
+    )
     return data
 
 
@@ -301,11 +302,11 @@ def _B_sup_zeta_r(params, transforms, profiles, data, **kwargs):
 )
 def _B_r(params, transforms, profiles, data, **kwargs):
     data["B_r"] = (
-        data["B^theta_r"] * data["e_theta"].T
-        + data["B^theta"] * data["e_theta_r"].T
-        + data["B^zeta_r"] * data["e_zeta"].T
-        + data["B^zeta"] * data["e_zeta_r"].T
-    ).T
+        data["B^theta_r"][:, None] * data["e_theta"]
+        + data["B^theta"][:, None] * data["e_theta_r"]
+        + data["B^zeta_r"][:, None] * data["e_zeta"]
+        + data["B^zeta"][:, None] * data["e_zeta_r"]
+    )
     return data
 
 
@@ -419,11 +420,11 @@ def _B_sup_zeta_t(params, transforms, profiles, data, **kwargs):
 )
 def _B_t(params, transforms, profiles, data, **kwargs):
     data["B_t"] = (
-        data["B^theta_t"] * data["e_theta"].T
-        + data["B^theta"] * data["e_theta_t"].T
-        + data["B^zeta_t"] * data["e_zeta"].T
-        + data["B^zeta"] * data["e_zeta_t"].T
-    ).T
+        data["B^theta_t"][:, None] * data["e_theta"]
+        + data["B^theta"][:, None] * data["e_theta_t"]
+        + data["B^zeta_t"][:, None] * data["e_zeta"]
+        + data["B^zeta"][:, None] * data["e_zeta_t"]
+    )
     return data
 
 
@@ -580,11 +581,11 @@ def _B_sup_zeta_z_ra(params, transforms, profiles, data, **kwargs):
 )
 def _B_z(params, transforms, profiles, data, **kwargs):
     data["B_z"] = (
-        data["B^theta_z"] * data["e_theta"].T
-        + data["B^theta"] * data["e_theta_z"].T
-        + data["B^zeta_z"] * data["e_zeta"].T
-        + data["B^zeta"] * data["e_zeta_z"].T
-    ).T
+        data["B^theta_z"][:, None] * data["e_theta"]
+        + data["B^theta"][:, None] * data["e_theta_z"]
+        + data["B^zeta_z"][:, None] * data["e_zeta"]
+        + data["B^zeta"][:, None] * data["e_zeta_z"]
+    )
     return data
 
 
@@ -750,13 +751,13 @@ def _B_sup_zeta_rr(params, transforms, profiles, data, **kwargs):
 )
 def _B_rr(params, transforms, profiles, data, **kwargs):
     data["B_rr"] = (
-        data["B^theta_rr"] * data["e_theta"].T
-        + 2 * data["B^theta_r"] * data["e_theta_r"].T
-        + data["B^theta"] * data["e_theta_rr"].T
-        + data["B^zeta_rr"] * data["e_zeta"].T
-        + 2 * data["B^zeta_r"] * data["e_zeta_r"].T
-        + data["B^zeta"] * data["e_zeta_rr"].T
-    ).T
+        data["B^theta_rr"][:, None] * data["e_theta"]
+        + 2 * data["B^theta_r"][:, None] * data["e_theta_r"]
+        + data["B^theta"][:, None] * data["e_theta_rr"]
+        + data["B^zeta_rr"][:, None] * data["e_zeta"]
+        + 2 * data["B^zeta_r"][:, None] * data["e_zeta_r"]
+        + data["B^zeta"][:, None] * data["e_zeta_rr"]
+    )
     return data
 
 
@@ -896,13 +897,13 @@ def _B_sup_zeta_tt(params, transforms, profiles, data, **kwargs):
 )
 def _B_tt(params, transforms, profiles, data, **kwargs):
     data["B_tt"] = (
-        data["B^theta_tt"] * data["e_theta"].T
-        + 2 * data["B^theta_t"] * data["e_theta_t"].T
-        + data["B^theta"] * data["e_theta_tt"].T
-        + data["B^zeta_tt"] * data["e_zeta"].T
-        + 2 * data["B^zeta_t"] * data["e_zeta_t"].T
-        + data["B^zeta"] * data["e_zeta_tt"].T
-    ).T
+        data["B^theta_tt"][:, None] * data["e_theta"]
+        + 2 * data["B^theta_t"][:, None] * data["e_theta_t"]
+        + data["B^theta"][:, None] * data["e_theta_tt"]
+        + data["B^zeta_tt"][:, None] * data["e_zeta"]
+        + 2 * data["B^zeta_t"][:, None] * data["e_zeta_t"]
+        + data["B^zeta"][:, None] * data["e_zeta_tt"]
+    )
     return data
 
 
@@ -1042,13 +1043,13 @@ def _B_sup_zeta_zz(params, transforms, profiles, data, **kwargs):
 )
 def _B_zz(params, transforms, profiles, data, **kwargs):
     data["B_zz"] = (
-        data["B^theta_zz"] * data["e_theta"].T
-        + 2 * data["B^theta_z"] * data["e_theta_z"].T
-        + data["B^theta"] * data["e_theta_zz"].T
-        + data["B^zeta_zz"] * data["e_zeta"].T
-        + 2 * data["B^zeta_z"] * data["e_zeta_z"].T
-        + data["B^zeta"] * data["e_zeta_zz"].T
-    ).T
+        data["B^theta_zz"][:, None] * data["e_theta"]
+        + 2 * data["B^theta_z"][:, None] * data["e_theta_z"]
+        + data["B^theta"][:, None] * data["e_theta_zz"]
+        + data["B^zeta_zz"][:, None] * data["e_zeta"]
+        + 2 * data["B^zeta_z"][:, None] * data["e_zeta_z"]
+        + data["B^zeta"][:, None] * data["e_zeta_zz"]
+    )
     return data
 
 
@@ -1225,15 +1226,15 @@ def _B_sup_zeta_rt(params, transforms, profiles, data, **kwargs):
 )
 def _B_rt(params, transforms, profiles, data, **kwargs):
     data["B_rt"] = (
-        data["B^theta_rt"] * data["e_theta"].T
-        + data["B^theta_r"] * data["e_theta_t"].T
-        + data["B^theta_t"] * data["e_theta_r"].T
-        + data["B^theta"] * data["e_theta_rt"].T
-        + data["B^zeta_rt"] * data["e_zeta"].T
-        + data["B^zeta_r"] * data["e_zeta_t"].T
-        + data["B^zeta_t"] * data["e_zeta_r"].T
-        + data["B^zeta"] * data["e_zeta_rt"].T
-    ).T
+        data["B^theta_rt"][:, None] * data["e_theta"]
+        + data["B^theta_r"][:, None] * data["e_theta_t"]
+        + data["B^theta_t"][:, None] * data["e_theta_r"]
+        + data["B^theta"][:, None] * data["e_theta_rt"]
+        + data["B^zeta_rt"][:, None] * data["e_zeta"]
+        + data["B^zeta_r"][:, None] * data["e_zeta_t"]
+        + data["B^zeta_t"][:, None] * data["e_zeta_r"]
+        + data["B^zeta"][:, None] * data["e_zeta_rt"]
+    )
     return data
 
 
@@ -1391,15 +1392,15 @@ def _B_sup_zeta_tz(params, transforms, profiles, data, **kwargs):
 )
 def _B_tz(params, transforms, profiles, data, **kwargs):
     data["B_tz"] = (
-        data["B^theta_tz"] * data["e_theta"].T
-        + data["B^theta_t"] * data["e_theta_z"].T
-        + data["B^theta_z"] * data["e_theta_t"].T
-        + data["B^theta"] * data["e_theta_tz"].T
-        + data["B^zeta_tz"] * data["e_zeta"].T
-        + data["B^zeta_t"] * data["e_zeta_z"].T
-        + data["B^zeta_z"] * data["e_zeta_t"].T
-        + data["B^zeta"] * data["e_zeta_tz"].T
-    ).T
+        data["B^theta_tz"][:, None] * data["e_theta"]
+        + data["B^theta_t"][:, None] * data["e_theta_z"]
+        + data["B^theta_z"][:, None] * data["e_theta_t"]
+        + data["B^theta"][:, None] * data["e_theta_tz"]
+        + data["B^zeta_tz"][:, None] * data["e_zeta"]
+        + data["B^zeta_t"][:, None] * data["e_zeta_z"]
+        + data["B^zeta_z"][:, None] * data["e_zeta_t"]
+        + data["B^zeta"][:, None] * data["e_zeta_tz"]
+    )
     return data
 
 
@@ -1576,15 +1577,15 @@ def _B_sup_zeta_rz(params, transforms, profiles, data, **kwargs):
 )
 def _B_rz(params, transforms, profiles, data, **kwargs):
     data["B_rz"] = (
-        data["B^theta_rz"] * data["e_theta"].T
-        + data["B^theta_r"] * data["e_theta_z"].T
-        + data["B^theta_z"] * data["e_theta_r"].T
-        + data["B^theta"] * data["e_theta_rz"].T
-        + data["B^zeta_rz"] * data["e_zeta"].T
-        + data["B^zeta_r"] * data["e_zeta_z"].T
-        + data["B^zeta_z"] * data["e_zeta_r"].T
-        + data["B^zeta"] * data["e_zeta_rz"].T
-    ).T
+        data["B^theta_rz"][:, None] * data["e_theta"]
+        + data["B^theta_r"][:, None] * data["e_theta_z"]
+        + data["B^theta_z"][:, None] * data["e_theta_r"]
+        + data["B^theta"][:, None] * data["e_theta_rz"]
+        + data["B^zeta_rz"][:, None] * data["e_zeta"]
+        + data["B^zeta_r"][:, None] * data["e_zeta_z"]
+        + data["B^zeta_z"][:, None] * data["e_zeta_r"]
+        + data["B^zeta"][:, None] * data["e_zeta_rz"]
+    )
     return data
 
 
@@ -2496,13 +2497,17 @@ def _B_mag_z_constant_rho_alpha(params, transforms, profiles, data, **kwargs):
 )
 def _B_mag_rr(params, transforms, profiles, data, **kwargs):
     data["|B|_rr"] = (
-        data["B^theta_rr"] * data["B_theta"]
-        + 2 * data["B^theta_r"] * data["B_theta_r"]
-        + data["B^theta"] * data["B_theta_rr"]
-        + data["B^zeta_rr"] * data["B_zeta"]
-        + 2 * data["B^zeta_r"] * data["B_zeta_r"]
-        + data["B^zeta"] * data["B_zeta_rr"]
-    ) / (2 * data["|B|"]) - data["|B|_r"] ** 2 / data["|B|"]
+        (
+            data["B^theta_rr"] * data["B_theta"]
+            + 2 * data["B^theta_r"] * data["B_theta_r"]
+            + data["B^theta"] * data["B_theta_rr"]
+            + data["B^zeta_rr"] * data["B_zeta"]
+            + 2 * data["B^zeta_r"] * data["B_zeta_r"]
+            + data["B^zeta"] * data["B_zeta_rr"]
+        )
+        / 2
+        - data["|B|_r"] ** 2
+    ) / data["|B|"]
     return data
 
 
@@ -2536,13 +2541,17 @@ def _B_mag_rr(params, transforms, profiles, data, **kwargs):
 )
 def _B_mag_tt(params, transforms, profiles, data, **kwargs):
     data["|B|_tt"] = (
-        data["B^theta_tt"] * data["B_theta"]
-        + 2 * data["B^theta_t"] * data["B_theta_t"]
-        + data["B^theta"] * data["B_theta_tt"]
-        + data["B^zeta_tt"] * data["B_zeta"]
-        + 2 * data["B^zeta_t"] * data["B_zeta_t"]
-        + data["B^zeta"] * data["B_zeta_tt"]
-    ) / (2 * data["|B|"]) - data["|B|_t"] ** 2 / data["|B|"]
+        (
+            data["B^theta_tt"] * data["B_theta"]
+            + 2 * data["B^theta_t"] * data["B_theta_t"]
+            + data["B^theta"] * data["B_theta_tt"]
+            + data["B^zeta_tt"] * data["B_zeta"]
+            + 2 * data["B^zeta_t"] * data["B_zeta_t"]
+            + data["B^zeta"] * data["B_zeta_tt"]
+        )
+        / 2
+        - data["|B|_t"] ** 2
+    ) / data["|B|"]
     return data
 
 
@@ -2576,13 +2585,17 @@ def _B_mag_tt(params, transforms, profiles, data, **kwargs):
 )
 def _B_mag_zz(params, transforms, profiles, data, **kwargs):
     data["|B|_zz"] = (
-        data["B^theta_zz"] * data["B_theta"]
-        + 2 * data["B^theta_z"] * data["B_theta_z"]
-        + data["B^theta"] * data["B_theta_zz"]
-        + data["B^zeta_zz"] * data["B_zeta"]
-        + 2 * data["B^zeta_z"] * data["B_zeta_z"]
-        + data["B^zeta"] * data["B_zeta_zz"]
-    ) / (2 * data["|B|"]) - data["|B|_z"] ** 2 / data["|B|"]
+        (
+            data["B^theta_zz"] * data["B_theta"]
+            + 2 * data["B^theta_z"] * data["B_theta_z"]
+            + data["B^theta"] * data["B_theta_zz"]
+            + data["B^zeta_zz"] * data["B_zeta"]
+            + 2 * data["B^zeta_z"] * data["B_zeta_z"]
+            + data["B^zeta"] * data["B_zeta_zz"]
+        )
+        / 2
+        - data["|B|_z"] ** 2
+    ) / data["|B|"]
     return data
 
 
@@ -2622,15 +2635,19 @@ def _B_mag_zz(params, transforms, profiles, data, **kwargs):
 )
 def _B_mag_rt(params, transforms, profiles, data, **kwargs):
     data["|B|_rt"] = (
-        data["B^theta_rt"] * data["B_theta"]
-        + data["B^theta_r"] * data["B_theta_t"]
-        + data["B^theta_t"] * data["B_theta_r"]
-        + data["B^theta"] * data["B_theta_rt"]
-        + data["B^zeta_rt"] * data["B_zeta"]
-        + data["B^zeta_r"] * data["B_zeta_t"]
-        + data["B^zeta_t"] * data["B_zeta_r"]
-        + data["B^zeta"] * data["B_zeta_rt"]
-    ) / (2 * data["|B|"]) - data["|B|_r"] * data["|B|_t"] / data["|B|"]
+        (
+            data["B^theta_rt"] * data["B_theta"]
+            + data["B^theta_r"] * data["B_theta_t"]
+            + data["B^theta_t"] * data["B_theta_r"]
+            + data["B^theta"] * data["B_theta_rt"]
+            + data["B^zeta_rt"] * data["B_zeta"]
+            + data["B^zeta_r"] * data["B_zeta_t"]
+            + data["B^zeta_t"] * data["B_zeta_r"]
+            + data["B^zeta"] * data["B_zeta_rt"]
+        )
+        / 2
+        - data["|B|_r"] * data["|B|_t"]
+    ) / data["|B|"]
     return data
 
 
@@ -2670,15 +2687,19 @@ def _B_mag_rt(params, transforms, profiles, data, **kwargs):
 )
 def _B_mag_tz(params, transforms, profiles, data, **kwargs):
     data["|B|_tz"] = (
-        data["B^theta_tz"] * data["B_theta"]
-        + data["B^theta_t"] * data["B_theta_z"]
-        + data["B^theta_z"] * data["B_theta_t"]
-        + data["B^theta"] * data["B_theta_tz"]
-        + data["B^zeta_tz"] * data["B_zeta"]
-        + data["B^zeta_t"] * data["B_zeta_z"]
-        + data["B^zeta_z"] * data["B_zeta_t"]
-        + data["B^zeta"] * data["B_zeta_tz"]
-    ) / (2 * data["|B|"]) - data["|B|_t"] * data["|B|_z"] / data["|B|"]
+        (
+            data["B^theta_tz"] * data["B_theta"]
+            + data["B^theta_t"] * data["B_theta_z"]
+            + data["B^theta_z"] * data["B_theta_t"]
+            + data["B^theta"] * data["B_theta_tz"]
+            + data["B^zeta_tz"] * data["B_zeta"]
+            + data["B^zeta_t"] * data["B_zeta_z"]
+            + data["B^zeta_z"] * data["B_zeta_t"]
+            + data["B^zeta"] * data["B_zeta_tz"]
+        )
+        / 2
+        - data["|B|_t"] * data["|B|_z"]
+    ) / data["|B|"]
     return data
 
 
@@ -2718,15 +2739,19 @@ def _B_mag_tz(params, transforms, profiles, data, **kwargs):
 )
 def _B_mag_rz(params, transforms, profiles, data, **kwargs):
     data["|B|_rz"] = (
-        data["B^theta_rz"] * data["B_theta"]
-        + data["B^theta_r"] * data["B_theta_z"]
-        + data["B^theta_z"] * data["B_theta_r"]
-        + data["B^theta"] * data["B_theta_rz"]
-        + data["B^zeta_rz"] * data["B_zeta"]
-        + data["B^zeta_r"] * data["B_zeta_z"]
-        + data["B^zeta_z"] * data["B_zeta_r"]
-        + data["B^zeta"] * data["B_zeta_rz"]
-    ) / (2 * data["|B|"]) - data["|B|_r"] * data["|B|_z"] / data["|B|"]
+        (
+            data["B^theta_rz"] * data["B_theta"]
+            + data["B^theta_r"] * data["B_theta_z"]
+            + data["B^theta_z"] * data["B_theta_r"]
+            + data["B^theta"] * data["B_theta_rz"]
+            + data["B^zeta_rz"] * data["B_zeta"]
+            + data["B^zeta_r"] * data["B_zeta_z"]
+            + data["B^zeta_z"] * data["B_zeta_r"]
+            + data["B^zeta"] * data["B_zeta_rz"]
+        )
+        / 2
+        - data["|B|_r"] * data["|B|_z"]
+    ) / data["|B|"]
     return data
 
 
@@ -2746,14 +2771,14 @@ def _B_mag_rz(params, transforms, profiles, data, **kwargs):
 )
 def _grad_B(params, transforms, profiles, data, **kwargs):
     data["grad(|B|)"] = (
-        data["|B|_r"] * data["e^rho"].T
+        data["|B|_r"][:, None] * data["e^rho"]
         + transforms["grid"].replace_at_axis(
             safediv(data["|B|_t"], data["sqrt(g)"]),
             lambda: safediv(data["|B|_rt"], data["sqrt(g)_r"]),
-        )
-        * data["e^theta*sqrt(g)"].T
-        + data["|B|_z"] * data["e^zeta"].T
-    ).T
+        )[:, None]
+        * data["e^theta*sqrt(g)"]
+        + data["|B|_z"][:, None] * data["e^zeta"]
+    )
     return data
 
 
@@ -3020,7 +3045,7 @@ def _gradB2_zeta(params, transforms, profiles, data, **kwargs):
     data=["|B|", "grad(|B|)"],
 )
 def _gradB2(params, transforms, profiles, data, **kwargs):
-    data["grad(|B|^2)"] = 2 * (data["|B|"] * data["grad(|B|)"].T).T
+    data["grad(|B|^2)"] = 2 * data["|B|"][:, None] * data["grad(|B|)"]
     return data
 
 
@@ -3146,10 +3171,10 @@ def _curl_B_x_B_zeta(params, transforms, profiles, data, **kwargs):
 def _curl_B_x_B(params, transforms, profiles, data, **kwargs):
     # (curl(B)xB)_theta e^theta refactored to resolve indeterminacy at axis.
     data["curl(B)xB"] = (
-        data["(curl(B)xB)_rho"] * data["e^rho"].T
-        - mu_0 * data["B^zeta"] * data["J^rho"] * data["e^theta*sqrt(g)"].T
-        + data["(curl(B)xB)_zeta"] * data["e^zeta"].T
-    ).T
+        data["(curl(B)xB)_rho"][:, None] * data["e^rho"]
+        - (mu_0 * data["B^zeta"] * data["J^rho"])[:, None] * data["e^theta*sqrt(g)"]
+        + data["(curl(B)xB)_zeta"][:, None] * data["e^zeta"]
+    )
     return data
 
 
@@ -3481,10 +3506,10 @@ def _effective_r_over_R0(params, transforms, profiles, data, **kwargs):
     data=["J", "|B|", "b", "grad(|B|)"],
 )
 def _kappa(params, transforms, profiles, data, **kwargs):
-    data["kappa"] = -(
-        cross(data["b"], mu_0 * data["J"] + cross(data["b"], data["grad(|B|)"])).T
-        / data["|B|"]
-    ).T
+    data["kappa"] = (
+        -cross(data["b"], mu_0 * data["J"] + cross(data["b"], data["grad(|B|)"]))
+        / data["|B|"][:, None]
+    )
     return data
 
 
@@ -3520,7 +3545,7 @@ def _kappa_n(params, transforms, profiles, data, **kwargs):
     data=["kappa", "n_rho", "b"],
 )
 def _kappa_g(params, transforms, profiles, data, **kwargs):
-    data["kappa_g"] = dot(data["kappa"], cross(data["n_rho"], data["b"]))
+    data["kappa_g"] = triple(data["kappa"], data["n_rho"], data["b"])
     return data
 
 
@@ -15,7 +15,31 @@ from desc.backend import jnp
 
 from ..integrals.surface_integral import surface_averages
 from .data_index import register_compute_fun
-from .utils import cross, dot, safediv, safenorm
+from .utils import cross, dot, safediv, safenorm, triple
+
+
+def _sum_triple_products(terms):
+    """Sum of scaled triple products a ⋅ (b × c).
+
+    The derivatives of sqrt(g) expand into many such products. Rather than forming
+    a cross product and a dot product for each one, the operands are stacked along
+    a leading axis and contracted together as a signed 3x3 determinant.
+
+    Parameters
+    ----------
+    terms : list of tuple
+        Each entry is ``(coef, a, b, c)`` where ``coef`` is a scalar and ``a``,
+        ``b``, ``c`` are arrays of vectors with shape (N, 3).
+
+    Returns
+    -------
+    s : ndarray
+        Shape (N, ). Sum of coef * a ⋅ (b × c) over all terms.
+
+    """
+    coef, a, b, c = zip(*terms)
+    det = triple(jnp.stack(a), jnp.stack(b), jnp.stack(c))
+    return jnp.asarray(coef, dtype=det.dtype) @ det
 
 
 @register_compute_fun(
@@ -29,10 +53,20 @@ from .utils import cross, dot, safediv, safenorm
     transforms={},
     profiles=[],
     coordinates="rtz",
-    data=["e_rho", "e_theta", "e_zeta"],
+    data=[
+        "R", "R_r", "R_t", "R_z", "Z_r", "Z_t", "Z_z", "omega_r", "omega_t", "omega_z"
+    ],
 )
 def _sqrtg(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)"] = dot(data["e_rho"], cross(data["e_theta"], data["e_zeta"]))
+    # Same as triple(data["e_rho"], data["e_theta"], data["e_zeta"]), but expanded
+    # along the toroidal component so that the basis vectors need not be formed.
+    # Only 𝐞_ζ has a toroidal component independent of ω, so most terms vanish
+    # when ω = 0.
+    data["sqrt(g)"] = data["R"] * (
+        (1 + data["omega_z"]) * (data["R_t"] * data["Z_r"] - data["R_r"] * data["Z_t"])
+        + data["omega_t"] * (data["R_r"] * data["Z_z"] - data["R_z"] * data["Z_r"])
+        - data["omega_r"] * (data["R_t"] * data["Z_z"] - data["R_z"] * data["Z_t"])
+    )
     return data
 
 
@@ -360,10 +394,12 @@ def _e_rho_x_e_theta_rr(params, transforms, profiles, data, **kwargs):
     data=["e_rho", "e_theta", "e_zeta", "e_rho_r", "e_theta_r", "e_zeta_r"],
 )
 def _sqrtg_r(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_r"] = (
-        dot(data["e_rho_r"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_r"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_r"]))
+    data["sqrt(g)_r"] = _sum_triple_products(
+        [
+            (1, data["e_rho_r"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_r"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_r"]),
+        ],
     )
     return data
 
@@ -383,10 +419,12 @@ def _sqrtg_r(params, transforms, profiles, data, **kwargs):
     data=["e_rho", "e_theta", "e_zeta", "e_rho_t", "e_theta_t", "e_zeta_t"],
 )
 def _sqrtg_t(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_t"] = (
-        dot(data["e_rho_t"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_t"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_t"]))
+    data["sqrt(g)_t"] = _sum_triple_products(
+        [
+            (1, data["e_rho_t"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_t"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_t"]),
+        ],
     )
     return data
 
@@ -406,10 +444,12 @@ def _sqrtg_t(params, transforms, profiles, data, **kwargs):
     data=["e_rho", "e_theta", "e_zeta", "e_rho_z", "e_theta_z", "e_zeta_z"],
 )
 def _sqrtg_z(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_z"] = (
-        dot(data["e_rho_z"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_z"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_z"]))
+    data["sqrt(g)_z"] = _sum_triple_products(
+        [
+            (1, data["e_rho_z"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_z"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_z"]),
+        ],
     )
     return data
 
@@ -439,13 +479,15 @@ def _sqrtg_z(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rr(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rr"] = (
-        dot(data["e_rho_rr"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_rr"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_rr"]))
-        + 2 * dot(data["e_rho_r"], cross(data["e_theta_r"], data["e_zeta"]))
-        + 2 * dot(data["e_rho_r"], cross(data["e_theta"], data["e_zeta_r"]))
-        + 2 * dot(data["e_rho"], cross(data["e_theta_r"], data["e_zeta_r"]))
+    data["sqrt(g)_rr"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rr"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_rr"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rr"]),
+            (2, data["e_rho_r"], data["e_theta_r"], data["e_zeta"]),
+            (2, data["e_rho_r"], data["e_theta"], data["e_zeta_r"]),
+            (2, data["e_rho"], data["e_theta_r"], data["e_zeta_r"]),
+        ],
     )
     return data
 
@@ -478,17 +520,19 @@ def _sqrtg_rr(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rrr(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rrr"] = (
-        dot(data["e_rho_rrr"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_rrr"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_rrr"]))
-        + 3 * dot(data["e_rho_rr"], cross(data["e_theta_r"], data["e_zeta"]))
-        + 3 * dot(data["e_rho_rr"], cross(data["e_theta"], data["e_zeta_r"]))
-        + 3 * dot(data["e_rho_r"], cross(data["e_theta_rr"], data["e_zeta"]))
-        + 3 * dot(data["e_rho"], cross(data["e_theta_rr"], data["e_zeta_r"]))
-        + 3 * dot(data["e_rho_r"], cross(data["e_theta"], data["e_zeta_rr"]))
-        + 3 * dot(data["e_rho"], cross(data["e_theta_r"], data["e_zeta_rr"]))
-        + 6 * dot(data["e_rho_r"], cross(data["e_theta_r"], data["e_zeta_r"]))
+    data["sqrt(g)_rrr"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rrr"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_rrr"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rrr"]),
+            (3, data["e_rho_rr"], data["e_theta_r"], data["e_zeta"]),
+            (3, data["e_rho_rr"], data["e_theta"], data["e_zeta_r"]),
+            (3, data["e_rho_r"], data["e_theta_rr"], data["e_zeta"]),
+            (3, data["e_rho"], data["e_theta_rr"], data["e_zeta_r"]),
+            (3, data["e_rho_r"], data["e_theta"], data["e_zeta_rr"]),
+            (3, data["e_rho"], data["e_theta_r"], data["e_zeta_rr"]),
+            (6, data["e_rho_r"], data["e_theta_r"], data["e_zeta_r"]),
+        ],
     )
     return data
 
@@ -527,41 +571,26 @@ def _sqrtg_rrr(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rrt(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rrt"] = (
-        dot(data["e_rho_rrt"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(
-            data["e_rho_rr"],
-            cross(data["e_theta_t"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_t"]),
-        )
-        + 2
-        * dot(
-            data["e_rho_rt"],
-            cross(data["e_theta_r"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_r"]),
-        )
-        + 2
-        * dot(
-            data["e_rho_r"],
-            cross(data["e_theta_rt"], data["e_zeta"])
-            + cross(data["e_theta_r"], data["e_zeta_t"])
-            + cross(data["e_theta_t"], data["e_zeta_r"])
-            + cross(data["e_theta"], data["e_zeta_rt"]),
-        )
-        + dot(
-            data["e_rho_t"],
-            cross(data["e_theta_rr"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_rr"]),
-        )
-        + dot(
-            data["e_rho"],
-            cross(data["e_theta_rrt"], data["e_zeta"])
-            + 2 * cross(data["e_theta_rt"], data["e_zeta_r"])
-            + cross(data["e_theta_rr"], data["e_zeta_t"])
-            + 2 * cross(data["e_theta_r"], data["e_zeta_rt"])
-            + cross(data["e_theta_t"], data["e_zeta_rr"])
-            + cross(data["e_theta"], data["e_zeta_rrt"]),
-        )
+    data["sqrt(g)_rrt"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rrt"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_rr"], data["e_theta_t"], data["e_zeta"]),
+            (1, data["e_rho_rr"], data["e_theta"], data["e_zeta_t"]),
+            (2, data["e_rho_rt"], data["e_theta_r"], data["e_zeta"]),
+            (2, data["e_rho_rt"], data["e_theta"], data["e_zeta_r"]),
+            (2, data["e_rho_r"], data["e_theta_rt"], data["e_zeta"]),
+            (2, data["e_rho_r"], data["e_theta_r"], data["e_zeta_t"]),
+            (2, data["e_rho_r"], data["e_theta_t"], data["e_zeta_r"]),
+            (2, data["e_rho_r"], data["e_theta"], data["e_zeta_rt"]),
+            (1, data["e_rho_t"], data["e_theta_rr"], data["e_zeta"]),
+            (1, data["e_rho_t"], data["e_theta"], data["e_zeta_rr"]),
+            (1, data["e_rho"], data["e_theta_rrt"], data["e_zeta"]),
+            (2, data["e_rho"], data["e_theta_rt"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta_rr"], data["e_zeta_t"]),
+            (2, data["e_rho"], data["e_theta_r"], data["e_zeta_rt"]),
+            (1, data["e_rho"], data["e_theta_t"], data["e_zeta_rr"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rrt"]),
+        ],
     )
     return data
 
@@ -591,13 +620,15 @@ def _sqrtg_rrt(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_tt(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_tt"] = (
-        dot(data["e_rho_tt"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_tt"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_tt"]))
-        + 2 * dot(data["e_rho_t"], cross(data["e_theta_t"], data["e_zeta"]))
-        + 2 * dot(data["e_rho_t"], cross(data["e_theta"], data["e_zeta_t"]))
-        + 2 * dot(data["e_rho"], cross(data["e_theta_t"], data["e_zeta_t"]))
+    data["sqrt(g)_tt"] = _sum_triple_products(
+        [
+            (1, data["e_rho_tt"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_tt"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_tt"]),
+            (2, data["e_rho_t"], data["e_theta_t"], data["e_zeta"]),
+            (2, data["e_rho_t"], data["e_theta"], data["e_zeta_t"]),
+            (2, data["e_rho"], data["e_theta_t"], data["e_zeta_t"]),
+        ],
     )
     return data
 
@@ -636,24 +667,26 @@ def _sqrtg_tt(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rtt(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rtt"] = (
-        dot(data["e_rho_rtt"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta_tt"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta"], data["e_zeta_tt"]))
-        + 2 * dot(data["e_rho_rt"], cross(data["e_theta_t"], data["e_zeta"]))
-        + 2 * dot(data["e_rho_rt"], cross(data["e_theta"], data["e_zeta_t"]))
-        + 2 * dot(data["e_rho_r"], cross(data["e_theta_t"], data["e_zeta_t"]))
-        + dot(data["e_rho_tt"], cross(data["e_theta_r"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_rtt"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_r"], data["e_zeta_tt"]))
-        + 2 * dot(data["e_rho_t"], cross(data["e_theta_rt"], data["e_zeta"]))
-        + 2 * dot(data["e_rho"], cross(data["e_theta_rt"], data["e_zeta_t"]))
-        + dot(data["e_rho_tt"], cross(data["e_theta"], data["e_zeta_r"]))
-        + dot(data["e_rho"], cross(data["e_theta_tt"], data["e_zeta_r"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_rtt"]))
-        + 2 * dot(data["e_rho_t"], cross(data["e_theta_t"], data["e_zeta_r"]))
-        + 2 * dot(data["e_rho_t"], cross(data["e_theta"], data["e_zeta_rt"]))
-        + 2 * dot(data["e_rho"], cross(data["e_theta_t"], data["e_zeta_rt"]))
+    data["sqrt(g)_rtt"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rtt"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta_tt"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta"], data["e_zeta_tt"]),
+            (2, data["e_rho_rt"], data["e_theta_t"], data["e_zeta"]),
+            (2, data["e_rho_rt"], data["e_theta"], data["e_zeta_t"]),
+            (2, data["e_rho_r"], data["e_theta_t"], data["e_zeta_t"]),
+            (1, data["e_rho_tt"], data["e_theta_r"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_rtt"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_r"], data["e_zeta_tt"]),
+            (2, data["e_rho_t"], data["e_theta_rt"], data["e_zeta"]),
+            (2, data["e_rho"], data["e_theta_rt"], data["e_zeta_t"]),
+            (1, data["e_rho_tt"], data["e_theta"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta_tt"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rtt"]),
+            (2, data["e_rho_t"], data["e_theta_t"], data["e_zeta_r"]),
+            (2, data["e_rho_t"], data["e_theta"], data["e_zeta_rt"]),
+            (2, data["e_rho"], data["e_theta_t"], data["e_zeta_rt"]),
+        ],
     )
     return data
 
@@ -683,13 +716,15 @@ def _sqrtg_rtt(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_zz(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_zz"] = (
-        dot(data["e_rho_zz"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_zz"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_zz"]))
-        + 2 * dot(data["e_rho_z"], cross(data["e_theta_z"], data["e_zeta"]))
-        + 2 * dot(data["e_rho_z"], cross(data["e_theta"], data["e_zeta_z"]))
-        + 2 * dot(data["e_rho"], cross(data["e_theta_z"], data["e_zeta_z"]))
+    data["sqrt(g)_zz"] = _sum_triple_products(
+        [
+            (1, data["e_rho_zz"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_zz"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_zz"]),
+            (2, data["e_rho_z"], data["e_theta_z"], data["e_zeta"]),
+            (2, data["e_rho_z"], data["e_theta"], data["e_zeta_z"]),
+            (2, data["e_rho"], data["e_theta_z"], data["e_zeta_z"]),
+        ],
     )
     return data
 
@@ -728,24 +763,26 @@ def _sqrtg_zz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rzz(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rzz"] = (
-        dot(data["e_rho_rzz"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta_zz"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta"], data["e_zeta_zz"]))
-        + 2 * dot(data["e_rho_rz"], cross(data["e_theta_z"], data["e_zeta"]))
-        + 2 * dot(data["e_rho_rz"], cross(data["e_theta"], data["e_zeta_z"]))
-        + 2 * dot(data["e_rho_r"], cross(data["e_theta_z"], data["e_zeta_z"]))
-        + dot(data["e_rho_zz"], cross(data["e_theta_r"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_rzz"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_r"], data["e_zeta_zz"]))
-        + 2 * dot(data["e_rho_z"], cross(data["e_theta_rz"], data["e_zeta"]))
-        + 2 * dot(data["e_rho_z"], cross(data["e_theta_r"], data["e_zeta_z"]))
-        + 2 * dot(data["e_rho"], cross(data["e_theta_rz"], data["e_zeta_z"]))
-        + dot(data["e_rho_zz"], cross(data["e_theta"], data["e_zeta_r"]))
-        + dot(data["e_rho"], cross(data["e_theta_zz"], data["e_zeta_r"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_rzz"]))
-        + 2 * dot(data["e_rho_z"], cross(data["e_theta"], data["e_zeta_rz"]))
-        + 2 * dot(data["e_rho"], cross(data["e_theta_z"], data["e_zeta_rz"]))
+    data["sqrt(g)_rzz"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rzz"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta_zz"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta"], data["e_zeta_zz"]),
+            (2, data["e_rho_rz"], data["e_theta_z"], data["e_zeta"]),
+            (2, data["e_rho_rz"], data["e_theta"], data["e_zeta_z"]),
+            (2, data["e_rho_r"], data["e_theta_z"], data["e_zeta_z"]),
+            (1, data["e_rho_zz"], data["e_theta_r"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_rzz"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_r"], data["e_zeta_zz"]),
+            (2, data["e_rho_z"], data["e_theta_rz"], data["e_zeta"]),
+            (2, data["e_rho_z"], data["e_theta_r"], data["e_zeta_z"]),
+            (2, data["e_rho"], data["e_theta_rz"], data["e_zeta_z"]),
+            (1, data["e_rho_zz"], data["e_theta"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta_zz"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rzz"]),
+            (2, data["e_rho_z"], data["e_theta"], data["e_zeta_rz"]),
+            (2, data["e_rho"], data["e_theta_z"], data["e_zeta_rz"]),
+        ],
     )
     return data
 
@@ -778,15 +815,17 @@ def _sqrtg_rzz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rt(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rt"] = (
-        dot(data["e_rho_rt"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta_t"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta"], data["e_zeta_t"]))
-        + dot(data["e_rho"], cross(data["e_theta_rt"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_r"], data["e_zeta_t"]))
-        + dot(data["e_rho_t"], cross(data["e_theta"], data["e_zeta_r"]))
-        + dot(data["e_rho"], cross(data["e_theta_t"], data["e_zeta_r"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_rt"]))
+    data["sqrt(g)_rt"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rt"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta_t"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta"], data["e_zeta_t"]),
+            (1, data["e_rho"], data["e_theta_rt"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_r"], data["e_zeta_t"]),
+            (1, data["e_rho_t"], data["e_theta"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta_t"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rt"]),
+        ],
     )
     return data
 
@@ -819,15 +858,17 @@ def _sqrtg_rt(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_tz(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_tz"] = (
-        dot(data["e_rho_tz"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho_z"], cross(data["e_theta_t"], data["e_zeta"]))
-        + dot(data["e_rho_z"], cross(data["e_theta"], data["e_zeta_t"]))
-        + dot(data["e_rho_t"], cross(data["e_theta_z"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_tz"], data["e_zeta"]))
-        + dot(data["e_rho_t"], cross(data["e_theta"], data["e_zeta_z"]))
-        + dot(data["e_rho"], cross(data["e_theta_t"], data["e_zeta_z"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_tz"]))
+    data["sqrt(g)_tz"] = _sum_triple_products(
+        [
+            (1, data["e_rho_tz"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_z"], data["e_theta_t"], data["e_zeta"]),
+            (1, data["e_rho_z"], data["e_theta"], data["e_zeta_t"]),
+            (1, data["e_rho_t"], data["e_theta_z"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_tz"], data["e_zeta"]),
+            (1, data["e_rho_t"], data["e_theta"], data["e_zeta_z"]),
+            (1, data["e_rho"], data["e_theta_t"], data["e_zeta_z"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_tz"]),
+        ],
     )
     return data
 
@@ -872,52 +913,33 @@ def _sqrtg_tz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rtz(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rtz"] = (
-        dot(data["e_rho_rtz"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(
-            data["e_rho_rz"],
-            cross(data["e_theta_t"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_t"]),
-        )
-        + dot(
-            data["e_rho_rt"],
-            cross(data["e_theta_z"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_z"]),
-        )
-        + dot(
-            data["e_rho_r"],
-            cross(data["e_theta_tz"], data["e_zeta"])
-            + cross(data["e_theta_t"], data["e_zeta_z"])
-            + cross(data["e_theta"], data["e_zeta_tz"]),
-        )
-        + dot(
-            data["e_rho_tz"],
-            cross(data["e_theta_r"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_r"]),
-        )
-        + dot(
-            data["e_rho_z"],
-            cross(data["e_theta_rt"], data["e_zeta"])
-            + cross(data["e_theta_r"], data["e_zeta_t"])
-            + cross(data["e_theta"], data["e_zeta_rt"]),
-        )
-        + dot(
-            data["e_rho_t"],
-            cross(data["e_theta_rz"], data["e_zeta"])
-            + cross(data["e_theta_z"], data["e_zeta_r"])
-            + cross(data["e_theta"], data["e_zeta_rz"]),
-        )
-        + dot(
-            data["e_rho"],
-            cross(data["e_theta_rtz"], data["e_zeta"])
-            + cross(data["e_theta_tz"], data["e_zeta_r"])
-            + cross(data["e_theta_rz"], data["e_zeta_t"])
-            + cross(data["e_theta_z"], data["e_zeta_rt"])
-            + cross(data["e_theta_rt"], data["e_zeta_z"])
-            + cross(data["e_theta_t"], data["e_zeta_rz"])
-            + cross(data["e_theta_r"], data["e_zeta_tz"])
-            + cross(data["e_theta"], data["e_zeta_rtz"]),
-        )
+    data["sqrt(g)_rtz"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rtz"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_rz"], data["e_theta_t"], data["e_zeta"]),
+            (1, data["e_rho_rz"], data["e_theta"], data["e_zeta_t"]),
+            (1, data["e_rho_rt"], data["e_theta_z"], data["e_zeta"]),
+            (1, data["e_rho_rt"], data["e_theta"], data["e_zeta_z"]),
+            (1, data["e_rho_r"], data["e_theta_tz"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta_t"], data["e_zeta_z"]),
+            (1, data["e_rho_r"], data["e_theta"], data["e_zeta_tz"]),
+            (1, data["e_rho_tz"], data["e_theta_r"], data["e_zeta"]),
+            (1, data["e_rho_tz"], data["e_theta"], data["e_zeta_r"]),
+            (1, data["e_rho_z"], data["e_theta_rt"], data["e_zeta"]),
+            (1, data["e_rho_z"], data["e_theta_r"], data["e_zeta_t"]),
+            (1, data["e_rho_z"], data["e_theta"], data["e_zeta_rt"]),
+            (1, data["e_rho_t"], data["e_theta_rz"], data["e_zeta"]),
+            (1, data["e_rho_t"], data["e_theta_z"], data["e_zeta_r"]),
+            (1, data["e_rho_t"], data["e_theta"], data["e_zeta_rz"]),
+            (1, data["e_rho"], data["e_theta_rtz"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_tz"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta_rz"], data["e_zeta_t"]),
+            (1, data["e_rho"], data["e_theta_z"], data["e_zeta_rt"]),
+            (1, data["e_rho"], data["e_theta_rt"], data["e_zeta_z"]),
+            (1, data["e_rho"], data["e_theta_t"], data["e_zeta_rz"]),
+            (1, data["e_rho"], data["e_theta_r"], data["e_zeta_tz"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rtz"]),
+        ],
     )
     return data
 
@@ -950,15 +972,17 @@ def _sqrtg_rtz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rz(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rz"] = (
-        dot(data["e_rho_rz"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta_z"], data["e_zeta"]))
-        + dot(data["e_rho_r"], cross(data["e_theta"], data["e_zeta_z"]))
-        + dot(data["e_rho_z"], cross(data["e_theta_r"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_rz"], data["e_zeta"]))
-        + dot(data["e_rho"], cross(data["e_theta_r"], data["e_zeta_z"]))
-        + dot(data["e_rho"], cross(data["e_theta_z"], data["e_zeta_r"]))
-        + dot(data["e_rho"], cross(data["e_theta"], data["e_zeta_rz"]))
+    data["sqrt(g)_rz"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rz"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta_z"], data["e_zeta"]),
+            (1, data["e_rho_r"], data["e_theta"], data["e_zeta_z"]),
+            (1, data["e_rho_z"], data["e_theta_r"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_rz"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_r"], data["e_zeta_z"]),
+            (1, data["e_rho"], data["e_theta_z"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rz"]),
+        ],
     )
     return data
 
@@ -997,41 +1021,26 @@ def _sqrtg_rz(params, transforms, profiles, data, **kwargs):
     ],
 )
 def _sqrtg_rrz(params, transforms, profiles, data, **kwargs):
-    data["sqrt(g)_rrz"] = (
-        dot(data["e_rho_rrz"], cross(data["e_theta"], data["e_zeta"]))
-        + dot(
-            data["e_rho_rr"],
-            cross(data["e_theta_z"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_z"]),
-        )
-        + 2
-        * dot(
-            data["e_rho_rz"],
-            cross(data["e_theta_r"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_r"]),
-        )
-        + 2
-        * dot(
-            data["e_rho_r"],
-            cross(data["e_theta_rz"], data["e_zeta"])
-            + cross(data["e_theta_r"], data["e_zeta_z"])
-            + cross(data["e_theta_z"], data["e_zeta_r"])
-            + cross(data["e_theta"], data["e_zeta_rz"]),
-        )
-        + dot(
-            data["e_rho_z"],
-            cross(data["e_theta_rr"], data["e_zeta"])
-            + cross(data["e_theta"], data["e_zeta_rr"]),
-        )
-        + dot(
-            data["e_rho"],
-            cross(data["e_theta_rrz"], data["e_zeta"])
-            + cross(data["e_theta_rr"], data["e_zeta_z"])
-            + 2 * cross(data["e_theta_r"], data["e_zeta_rz"])
-            + 2 * cross(data["e_theta_rz"], data["e_zeta_r"])
-            + cross(data["e_theta_z"], data["e_zeta_rr"])
-            + cross(data["e_theta"], data["e_zeta_rrz"]),
-        )
+    data["sqrt(g)_rrz"] = _sum_triple_products(
+        [
+            (1, data["e_rho_rrz"], data["e_theta"], data["e_zeta"]),
+            (1, data["e_rho_rr"], data["e_theta_z"], data["e_zeta"]),
+            (1, data["e_rho_rr"], data["e_theta"], data["e_zeta_z"]),
+            (2, data["e_rho_rz"], data["e_theta_r"], data["e_zeta"]),
+            (2, data["e_rho_rz"], data["e_theta"], data["e_zeta_r"]),
+            (2, data["e_rho_r"], data["e_theta_rz"], data["e_zeta"]),
+            (2, data["e_rho_r"], data["e_theta_r"], data["e_zeta_z"]),
+            (2, data["e_rho_r"], data["e_theta_z"], data["e_zeta_r"]),
+            (2, data["e_rho_r"], data["e_theta"], data["e_zeta_rz"]),
+            (1, data["e_rho_z"], data["e_theta_rr"], data["e_zeta"]),
+            (1, data["e_rho_z"], data["e_theta"], data["e_zeta_rr"]),
+            (1, data["e_rho"], data["e_theta_rrz"], data["e_zeta"]),
+            (1, data["e_rho"], data["e_theta_rr"], data["e_zeta_z"]),
+            (2, data["e_rho"], data["e_theta_r"], data["e_zeta_rz"]),
+            (2, data["e_rho"], data["e_theta_rz"], data["e_zeta_r"]),
+            (1, data["e_rho"], data["e_theta_z"], data["e_zeta_rr"]),
+            (1, data["e_rho"], data["e_theta"], data["e_zeta_rrz"]),
+        ],
     )
     return data
 
@@ -1922,7 +1931,7 @@ def _gbdrift(params, transforms, profiles, data, **kwargs):
     data["gbdrift"] = (
         1
         / data["|B|^2"]
-        * dot(data["b"], cross(data["grad(|B|)"], data["grad(alpha)"]))
+        * triple(data["b"], data["grad(|B|)"], data["grad(alpha)"])
     )
     return data
 
@@ -1971,6 +1980,6 @@ def _cvdrift(params, transforms, profiles, data, **kwargs):
 )
 def _cvdrift0(params, transforms, profiles, data, **kwargs):
     data["cvdrift0"] = (
-        1 / data["|B|^2"] * (dot(data["b"], cross(data["grad(|B|)"], data["e^rho"])))
+        1 / data["|B|^2"] * triple(data["b"], data["grad(|B|)"], data["e^rho"])
     )
     return data
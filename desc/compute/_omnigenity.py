@@ -14,7 +14,7 @@ from interpax import interp1d
 from desc.backend import jnp, sign, vmap
 
 from .data_index import register_compute_fun
-from .utils import cross, dot, safediv
+from .utils import safediv, triple
 
 
 @register_compute_fun(
@@ -612,6 +612,6 @@ def _B_omni(params, transforms, profiles, data, **kwargs):
 )
 def _isodynamicity(params, transforms, profiles, data, **kwargs):
     data["isodynamicity"] = (
-        dot(cross(data["b"], data["grad(|B|)"]), data["grad(psi)"]) / data["|B|"] ** 2
+        triple(data["grad(psi)"], data["b"], data["grad(|B|)"]) / data["|B|"] ** 2
     )
     return data
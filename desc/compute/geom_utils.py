@@ -1,7 +1,5 @@
 """Functions for converting between coordinate systems."""
 
-import functools
-
 from desc.backend import jnp
 
 from .utils import safenorm, safenormalize
@@ -112,20 +110,13 @@ def xyz2rpz_vec(vec, x=None, y=None, phi=None):
     if x is not None and y is not None:
         phi = jnp.arctan2(y, x)
 
-    @functools.partial(jnp.vectorize, signature="(3),()->(3)")
-    def inner(vec, phi):
-        rot = jnp.array(
-            [
-                [jnp.cos(phi), -jnp.sin(phi), jnp.zeros_like(phi)],
-                [jnp.sin(phi), jnp.cos(phi), jnp.zeros_like(phi)],
-                [jnp.zeros_like(phi), jnp.zeros_like(phi), jnp.ones_like(phi)],
-            ]
-        )
-        rot = rot.T
-        polar = jnp.matmul(rot, vec)
-        return polar
-
-    return inner(vec, phi)
+    # rotate about Z by -phi, without forming a 3x3 matrix for every point
+    vec = jnp.asarray(vec)
+    cos, sin = jnp.cos(phi), jnp.sin(phi)
+    vr = cos * vec[..., 0] + sin * vec[..., 1]
+    vp = cos * vec[..., 1] - sin * vec[..., 0]
+    vz = jnp.broadcast_to(vec[..., 2], vr.shape)
+    return jnp.stack([vr, vp, vz], axis=-1)
 
 
 def rpz2xyz_vec(vec, x=None, y=None, phi=None):
@@ -147,17 +138,10 @@ def rpz2xyz_vec(vec, x=None, y=None, phi=None):
     if x is not None and y is not None:
         phi = jnp.arctan2(y, x)
 
-    @functools.partial(jnp.vectorize, signature="(3),()->(3)")
-    def inner(vec, phi):
-        rot = jnp.array(
-            [
-                [jnp.cos(phi), jnp.sin(phi), jnp.zeros_like(phi)],
-                [-jnp.sin(phi), jnp.cos(phi), jnp.zeros_like(phi)],
-                [jnp.zeros_like(phi), jnp.zeros_like(phi), jnp.ones_like(phi)],
-            ]
-        )
-        rot = rot.T
-        cart = jnp.matmul(rot, vec)
-        return cart
-
-    return inner(vec, phi)
+    # rotate about Z by phi, without forming a 3x3 matrix for every point
+    vec = jnp.asarray(vec)
+    cos, sin = jnp.cos(phi), jnp.sin(phi)
+    vx = cos * vec[..., 0] - sin * vec[..., 1]
+    vy = sin * vec[..., 0] + cos * vec[..., 1]
+    vz = jnp.broadcast_to(vec[..., 2], vx.shape)
+    return jnp.stack([vx, vy, vz], axis=-1)
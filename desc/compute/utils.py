@@ -172,29 +172,32 @@ def _compute(
     if data is None:
         data = {}
 
+    index = data_index[parameterization]
+    has_axis = transforms["grid"].axis.size
     for name in names:
         if name in data:
             # don't compute something that's already been computed
             continue
-        if not has_data_dependencies(
-            parameterization, name, data, transforms["grid"].axis.size
+        entry = index[name]
+        deps = entry["dependencies"]
+        # same as has_data_dependencies, but reuses the entry looked up above
+        if not all(d in data for d in deps["data"]) or (
+            has_axis and not all(d in data for d in deps["axis_limit_data"])
         ):
             # then compute the missing dependencies
             data = _compute(
                 parameterization,
-                data_index[parameterization][name]["dependencies"]["data"],
+                deps["data"],
                 params=params,
                 transforms=transforms,
                 profiles=profiles,
                 data=data,
                 **kwargs,
             )
-            if transforms["grid"].axis.size:
+            if has_axis:
                 data = _compute(
                     parameterization,
-                    data_index[parameterization][name]["dependencies"][
-                        "axis_limit_data"
-                    ],
+                    deps["axis_limit_data"],
                     params=params,
                     transforms=transforms,
                     profiles=profiles,
@@ -202,7 +205,7 @@ def _compute(
                     **kwargs,
                 )
         # now compute the quantity
-        data = data_index[parameterization][name]["fun"](
+        data = entry["fun"](
             params=params, transforms=transforms, profiles=profiles, data=data, **kwargs
         )
     return data
@@ -701,16 +704,15 @@ def _has_profiles(qty, profiles, parameterization):
 
 def _has_transforms(qty, transforms, parameterization):
     p = _parse_parameterization(parameterization)
-    flags = {}
     derivs = data_index[p][qty]["dependencies"]["transforms"]
     for key in derivs.keys():
         if key not in transforms:
             return False
-        else:
-            flags[key] = np.array(
-                [d in transforms[key].derivatives.tolist() for d in derivs[key]]
-            ).all()
-    return all(flags.values())
+        if not len(derivs[key]):
+            continue  # eg the grid, which only needs to be present
+        if not transforms[key].has_derivatives(derivs[key]):
+            return False
+    return True
 
 
 def dot(a, b, axis=-1):
@@ -755,6 +757,34 @@ def cross(a, b, axis=-1):
     return jnp.cross(a, b, axis=axis)
 
 
+def triple(a, b, c):
+    """Batched scalar triple product.
+
+    Same as dot(a, cross(b, c)), but written out so that the intermediate cross
+    product is never formed.
+
+    Parameters
+    ----------
+    a : array-like
+        First array of vectors.
+    b : array-like
+        Second array of vectors.
+    c : array-like
+        Third array of vectors.
+
+    Returns
+    -------
+    y : array-like
+        y = a ⋅ (b x c), where vectors are stored along the last axis.
+
+    """
+    return (
+        a[..., 0] * (b[..., 1] * c[..., 2] - b[..., 2] * c[..., 1])
+        + a[..., 1] * (b[..., 2] * c[..., 0] - b[..., 0] * c[..., 2])
+        + a[..., 2] * (b[..., 0] * c[..., 1] - b[..., 1] * c[..., 0])
+    )
+
+
 def safenorm(x, ord=None, axis=None, fill=0, threshold=0):
     """Like jnp.linalg.norm, but without nan gradient at x=0.
 
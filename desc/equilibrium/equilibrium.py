@@ -56,6 +56,11 @@ from .initial_guess import set_initial_guess
 from .utils import parse_axis, parse_profile, parse_surface
 
 
+def _match_modes(modes, other):
+    """Boolean matrix, True where row i of modes equals row j of other."""
+    return np.all(modes[:, None, :] == other[None, :, :], axis=-1)
+
+
 class Equilibrium(IOAble, Optimizable):
     """Equilibrium is an object that represents a plasma equilibrium.
 
@@ -651,42 +656,18 @@ class Equilibrium(IOAble, Optimizable):
             surface = FourierRZToroidalSurface(sym=self.sym, NFP=self.NFP, rho=rho)
             surface.change_resolution(self.M, self.N)
 
-            AR = np.zeros((surface.R_basis.num_modes, self.R_basis.num_modes))
-            AZ = np.zeros((surface.Z_basis.num_modes, self.Z_basis.num_modes))
-
-            Js = []
-            zernikeR = zernike_radial(
-                rho, self.R_basis.modes[:, 0], self.R_basis.modes[:, 1]
+            # Match (m, n) of every surface mode against every equilibrium mode at
+            # once instead of searching the surface basis for each mode.
+            AR = np.where(
+                _match_modes(surface.R_basis.modes[:, 1:], self.R_basis.modes[:, 1:]),
+                zernike_radial(rho, self.R_basis.modes[:, 0], self.R_basis.modes[:, 1]),
+                0.0,
             )
-            for i, (l, m, n) in enumerate(self.R_basis.modes):
-                j = np.argwhere(
-                    np.logical_and(
-                        surface.R_basis.modes[:, 1] == m,
-                        surface.R_basis.modes[:, 2] == n,
-                    )
-                )
-                Js.append(j.flatten())
-            Js = np.array(Js)
-            # Broadcasting at once is faster. We need to use np.arange to avoid
-            # setting the value to the whole row.
-            AR[Js[:, 0], np.arange(self.R_basis.num_modes)] = zernikeR
-
-            Js = []
-            zernikeZ = zernike_radial(
-                rho, self.Z_basis.modes[:, 0], self.Z_basis.modes[:, 1]
+            AZ = np.where(
+                _match_modes(surface.Z_basis.modes[:, 1:], self.Z_basis.modes[:, 1:]),
+                zernike_radial(rho, self.Z_basis.modes[:, 0], self.Z_basis.modes[:, 1]),
+                0.0,
             )
-            for i, (l, m, n) in enumerate(self.Z_basis.modes):
-                j = np.argwhere(
-                    np.logical_and(
-                        surface.Z_basis.modes[:, 1] == m,
-                        surface.Z_basis.modes[:, 2] == n,
-                    )
-                )
-                Js.append(j.flatten())
-            Js = np.array(Js)
-            # Broadcasting at once is faster. We need to use np.arange to avoid
-            # setting the value to the whole row.
-            AZ[Js[:, 0], np.arange(self.Z_basis.num_modes)] = zernikeZ
 
             Rb = AR @ self.R_lmn
             Zb = AZ @ self.Z_lmn
@@ -699,26 +680,16 @@ class Equilibrium(IOAble, Optimizable):
             surface = ZernikeRZToroidalSection(sym=self.sym, zeta=zeta)
             surface.change_resolution(self.L, self.M)
 
-            AR = np.zeros((surface.R_basis.num_modes, self.R_basis.num_modes))
-            AZ = np.zeros((surface.Z_basis.num_modes, self.Z_basis.num_modes))
-
-            for i, (l, m, n) in enumerate(self.R_basis.modes):
-                j = np.argwhere(
-                    np.logical_and(
-                        surface.R_basis.modes[:, 0] == l,
-                        surface.R_basis.modes[:, 1] == m,
-                    )
-                )
-                AR[j, i] = fourier(zeta, n, self.NFP)
-
-            for i, (l, m, n) in enumerate(self.Z_basis.modes):
-                j = np.argwhere(
-                    np.logical_and(
-                        surface.Z_basis.modes[:, 0] == l,
-                        surface.Z_basis.modes[:, 1] == m,
-                    )
-                )
-                AZ[j, i] = fourier(zeta, n, self.NFP)
+            AR = np.where(
+                _match_modes(surface.R_basis.modes[:, :2], self.R_basis.modes[:, :2]),
+                fourier(zeta, self.R_basis.modes[:, 2], self.NFP),
+                0.0,
+            )
+            AZ = np.where(
+                _match_modes(surface.Z_basis.modes[:, :2], self.Z_basis.modes[:, :2]),
+                fourier(zeta, self.Z_basis.modes[:, 2], self.NFP),
+                0.0,
+            )
             Rb = AR @ self.R_lmn
             Zb = AZ @ self.Z_lmn
             surface.R_lmn = Rb
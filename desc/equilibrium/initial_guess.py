@@ -318,9 +318,9 @@ def _initial_guess_surface(x_basis, b_lmn, b_basis, axis=None, mode=None, coord=
             if m != 0:
                 continue
             # index of basis mode with lowest radial power (l = |m|)
-            idx0 = np.where((x_basis.modes == [abs(m), m, n]).all(axis=1))[0]
+            idx0 = x_basis.get_idx(abs(m), m, n, error=False)
             # index of basis mode with second lowest radial power (l = |m| + 2)
-            idx2 = np.where((x_basis.modes == [abs(m) + 2, m, n]).all(axis=1))[0]
+            idx2 = x_basis.get_idx(abs(m) + 2, m, n, error=False)
             ax = np.where(axis[:, 0] == n)[0]
             if ax.size:
                 a_n = axis[ax[0], 1]  # use provided axis guess
@@ -190,15 +190,16 @@ class Curve(IOAble, Optimizable, ABC):
 
     def rotate(self, axis=[0, 0, 1], angle=0):
         """Rotate the curve by a fixed angle about axis in X,Y,Z coordinates."""
-        R = rotation_matrix(axis=axis, angle=angle)
-        self.rotmat = (R @ self.rotmat.reshape(3, 3)).flatten()
-        self.shift = self.shift @ R.T
+        self._transform(rotation_matrix(axis=axis, angle=angle))
 
     def flip(self, normal=[0, 0, 1]):
         """Flip the curve about the plane with specified normal in X,Y,Z coordinates."""
-        F = reflection_matrix(normal)
-        self.rotmat = (F @ self.rotmat.reshape(3, 3)).flatten()
-        self.shift = self.shift @ F.T
+        self._transform(reflection_matrix(normal))
+
+    def _transform(self, M):
+        """Apply an orthogonal transformation matrix M to the curve in X,Y,Z."""
+        self.rotmat = (M @ self.rotmat.reshape(3, 3)).flatten()
+        self.shift = self.shift @ M.T
 
     def __repr__(self):
         """Get the string form of the object."""
@@ -308,17 +308,17 @@ class FourierRZCurve(Curve):
 
 
 def _unclose_curve(X, Y, Z):
-    if np.allclose([X[0], Y[0], Z[0]], [X[-1], Y[-1], Z[-1]], atol=1e-14):
-        closedX, closedY, closedZ = X.copy(), Y.copy(), Z.copy()
+    flag = bool(np.allclose([X[0], Y[0], Z[0]], [X[-1], Y[-1], Z[-1]], atol=1e-14))
+    # fill all three closed coordinates in a single buffer rather than copying or
+    # appending to each one separately
+    closed = np.empty((3, len(X) + (not flag)))
+    for i, x in enumerate((X, Y, Z)):
+        closed[i, : len(x)] = x
+        if not flag:
+            closed[i, -1] = x[0]
+    if flag:
         X, Y, Z = X[:-1], Y[:-1], Z[:-1]
-        flag = True
-    else:
-        closedX, closedY, closedZ = (
-            np.append(X, X[0]),
-            np.append(Y, Y[0]),
-            np.append(Z, Z[0]),
-        )
-        flag = False
+    closedX, closedY, closedZ = closed
     return X, Y, Z, closedX, closedY, closedZ, flag
 
 
@@ -905,9 +905,11 @@ class SplineXYZCurve(Curve):
 
         X, Y, Z, closedX, closedY, closedZ, closed_flag = _unclose_curve(X, Y, Z)
 
-        self._X = X
-        self._Y = Y
-        self._Z = Z
+        # broadcasting and unclosing can leave strided views or integer arrays, so
+        # store contiguous float copies
+        self._X = np.ascontiguousarray(X, dtype=float)
+        self._Y = np.ascontiguousarray(Y, dtype=float)
+        self._Z = np.ascontiguousarray(Z, dtype=float)
 
         if isinstance(knots, str):
             assert knots == "arclength", f"got unknown arclength specification {knots}"
@@ -932,7 +934,7 @@ class SplineXYZCurve(Curve):
             errorif(knots[-1] > 2 * np.pi, ValueError, "knots must lie in [0, 2pi]")
             knots = knots[:-1] if closed_flag else knots
 
-        self._knots = knots
+        self._knots = np.ascontiguousarray(knots, dtype=float)
         self._method = method
 
     @optimizable_parameter
@@ -103,10 +103,8 @@ class FourierRZToroidalSurface(Surface):
         assert issubclass(modes_R.dtype.type, np.integer)
         assert issubclass(modes_Z.dtype.type, np.integer)
 
-        MR = np.max(abs(modes_R[:, 0]))
-        NR = np.max(abs(modes_R[:, 1]))
-        MZ = np.max(abs(modes_Z[:, 0]))
-        NZ = np.max(abs(modes_Z[:, 1]))
+        MR, NR = np.max(abs(modes_R[:, :2]), axis=0)
+        MZ, NZ = np.max(abs(modes_Z[:, :2]), axis=0)
         self._L = 0
         M = check_nonnegint(M, "M")
         N = check_nonnegint(N, "N")
@@ -853,10 +851,8 @@ class ZernikeRZToroidalSection(Surface):
         assert issubclass(modes_R.dtype.type, np.integer)
         assert issubclass(modes_Z.dtype.type, np.integer)
 
-        LR = np.max(abs(modes_R[:, 0]))
-        MR = np.max(abs(modes_R[:, 1]))
-        LZ = np.max(abs(modes_Z[:, 0]))
-        MZ = np.max(abs(modes_Z[:, 1]))
+        LR, MR = np.max(abs(modes_R[:, :2]), axis=0)
+        LZ, MZ = np.max(abs(modes_Z[:, :2]), axis=0)
         L = check_nonnegint(L, "L")
         M = check_nonnegint(M, "M")
         self._L = setdefault(L, max(LR, LZ))
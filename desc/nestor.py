@@ -33,8 +33,9 @@ def copy_vector_periods(vec, zetas):
     else:
         x, y = vec
     shp = x.shape
-    xx = x.reshape((*shp, 1)) * jnp.cos(zetas) - y.reshape((*shp, 1)) * jnp.sin(zetas)
-    yy = y.reshape((*shp, 1)) * jnp.cos(zetas) + x.reshape((*shp, 1)) * jnp.sin(zetas)
+    cos, sin = jnp.cos(zetas), jnp.sin(zetas)
+    xx = x.reshape((*shp, 1)) * cos - y.reshape((*shp, 1)) * sin
+    yy = y.reshape((*shp, 1)) * cos + x.reshape((*shp, 1)) * sin
     if vec.shape[0] == 3:
         zz = jnp.broadcast_to(z.reshape((*shp, 1)), (*shp, zetas.size))
         return jnp.array((xx, yy, zz))
@@ -72,18 +73,17 @@ def eval_surface_geometry(
     ntheta_sym = ntheta // 2 + 1 if sym else ntheta
     phi = jnp.linspace(0, 2 * jnp.pi, nzeta, endpoint=False) / NFP
 
-    R_2d = Rb_transform.transform(R_lmn, dt=0, dz=0).reshape((nzeta, ntheta)).T
-    R_t_2d = Rb_transform.transform(R_lmn, dt=1, dz=0).reshape((nzeta, ntheta)).T
-    R_z_2d = Rb_transform.transform(R_lmn, dt=0, dz=1).reshape((nzeta, ntheta)).T
-    R_tt_2d = Rb_transform.transform(R_lmn, dt=2, dz=0).reshape((nzeta, ntheta)).T
-    R_tz_2d = Rb_transform.transform(R_lmn, dt=1, dz=1).reshape((nzeta, ntheta)).T
-    R_zz_2d = Rb_transform.transform(R_lmn, dt=0, dz=2).reshape((nzeta, ntheta)).T
-    Z_2d = Zb_transform.transform(Z_lmn, dt=0, dz=0).reshape((nzeta, ntheta)).T
-    Z_t_2d = Zb_transform.transform(Z_lmn, dt=1, dz=0).reshape((nzeta, ntheta)).T
-    Z_z_2d = Zb_transform.transform(Z_lmn, dt=0, dz=1).reshape((nzeta, ntheta)).T
-    Z_tt_2d = Zb_transform.transform(Z_lmn, dt=2, dz=0).reshape((nzeta, ntheta)).T
-    Z_tz_2d = Zb_transform.transform(Z_lmn, dt=1, dz=1).reshape((nzeta, ntheta)).T
-    Z_zz_2d = Zb_transform.transform(Z_lmn, dt=0, dz=2).reshape((nzeta, ntheta)).T
+    derivs = [[0, 0, 0], [0, 1, 0], [0, 0, 1], [0, 2, 0], [0, 1, 1], [0, 0, 2]]
+    R_2d, R_t_2d, R_z_2d, R_tt_2d, R_tz_2d, R_zz_2d = (
+        Rb_transform.transform_batch(R_lmn, derivs)
+        .reshape((-1, nzeta, ntheta))
+        .transpose((0, 2, 1))
+    )
+    Z_2d, Z_t_2d, Z_z_2d, Z_tt_2d, Z_tz_2d, Z_zz_2d = (
+        Zb_transform.transform_batch(Z_lmn, derivs)
+        .reshape((-1, nzeta, ntheta))
+        .transpose((0, 2, 1))
+    )
 
     coords = {}
     coords["R_full"] = R_2d.flatten()
@@ -3058,7 +3058,7 @@ class FixOmniBmax(_FixedObjective):
         self._A = np.zeros((self._dim_f, basis.num_modes))
         m0_modes = basis.modes[np.nonzero(basis.modes[:, 1] == 0)[0]]
         for i, (l, m, n) in enumerate(m0_modes):
-            idx_0 = np.nonzero((basis.modes == [l, m, n]).all(axis=1))[0]
+            idx_0 = basis.get_idx(l, m, n)
             idx_m = np.nonzero(
                 np.logical_and(
                     (basis.modes[:, (0, 2)] == [l, n]).all(axis=1),
@@ -109,10 +109,15 @@ class Optimizable(ABC):
             Dictionary of ndarray of optimizable parameters.
 
         """
-        x_idx = self.x_idx
+        dimensions = self.dimensions
+        # contiguous slices instead of gathering with the index arrays from x_idx
+        split_idx = np.cumsum(  # must be np not jnp
+            [dimensions[arg] for arg in self.optimizable_params]
+        )
+        xs = jnp.split(jnp.asarray(x), split_idx)
         params = {}
-        for arg in self.optimizable_params:
-            params[arg] = jnp.atleast_1d(jnp.asarray(x[x_idx[arg]]))
+        for arg, xi in zip(self.optimizable_params, xs):
+            params[arg] = jnp.atleast_1d(xi)
         return params
 
     def _sort_args(self, args):
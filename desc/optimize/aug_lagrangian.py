@@ -44,7 +44,7 @@ def fmin_auglag(  # noqa: C901 - FIXME: simplify this
     verbose=1,
     maxiter=None,
     callback=None,
-    options={},
+    options=None,
 ):
     """Minimize a function with constraints using an augmented Lagrangian method.
 
@@ -206,6 +206,7 @@ def fmin_auglag(  # noqa: C901 - FIXME: simplify this
            Second Edition (2006).
 
     """
+    options = {} if options is None else options
     constraint = setdefault(
         constraint,
         NonlinearConstraint(  # create a dummy constraint
@@ -44,7 +44,7 @@ def lsq_auglag(  # noqa: C901 - FIXME: simplify this
     verbose=1,
     maxiter=None,
     callback=None,
-    options={},
+    options=None,
 ):
     """Minimize a function with constraints using an augmented Lagrangian method.
 
@@ -187,6 +187,7 @@ def lsq_auglag(  # noqa: C901 - FIXME: simplify this
            methods" (2000).
 
     """
+    options = {} if options is None else options
     constraint = setdefault(
         constraint,
         NonlinearConstraint(  # create a dummy constraint
@@ -446,6 +446,66 @@ class Transform(IOAble):
             )
         self._built_pinv = True
 
+    def _check_coefficients(self, c):
+        """Raise an error if the transform can't be applied to coefficients c."""
+        if not self.built:
+            raise RuntimeError(
+                "Transform must be precomputed with transform.build() before being used"
+            )
+
+        if self.basis.num_modes != c.size:
+            raise ValueError(
+                colored(
+                    "Coefficients dimension ({}) is incompatible with ".format(c.size)
+                    + "the number of basis modes({})".format(self.basis.num_modes),
+                    "red",
+                )
+            )
+
+    def _get_fft_matrix(self, dr, dt):
+        """Get matrix for the (dr, dt) derivative of the lm part of the basis."""
+        A = self.matrices["fft"].get(dr, {}).get(dt, {})
+        if isinstance(A, dict):
+            raise ValueError(
+                colored("Derivative orders are out of initialized bounds", "red")
+            )
+        return A
+
+    def _get_direct2_matrix(self, dz):
+        """Get matrix for the dz derivative of the n part of the basis."""
+        B = self.matrices["direct2"].get(dz, {})
+        if isinstance(B, dict):
+            raise ValueError(
+                colored("Derivative orders are out of initialized bounds", "red")
+            )
+        return B
+
+    def _coefficient_matrix(self, c):
+        """Reshape coefficients c into a (num_lm_modes, num_n_modes) matrix."""
+        c_mtrx = jnp.zeros((self.num_lm_modes * self.num_n_modes,))
+        return put(c_mtrx, self.fft_index, c).reshape((-1, self.num_n_modes))
+
+    def _fft_coefficients(self, c_mtrx, dz):
+        """Apply the dz derivative and inverse FFT in zeta to coefficient matrix."""
+        # differentiate
+        c_diff = c_mtrx[:, :: (-1) ** dz] * self.dk**dz * (-1) ** (dz > 1)
+        # re-format in complex notation
+        c_real = jnp.pad(
+            (self.num_z_nodes / 2)
+            * (c_diff[:, self.N + 1 :] - 1j * c_diff[:, self.N - 1 :: -1]),
+            ((0, 0), (0, self.pad_dim)),
+            mode="constant",
+        )
+        c_cplx = jnp.hstack(
+            (
+                self.num_z_nodes * c_diff[:, self.N, jnp.newaxis],
+                c_real,
+                jnp.fliplr(jnp.conj(c_real)),
+            )
+        )
+        # transform coefficients
+        return jnp.real(jnp.fft.ifft(c_cplx))
+
     def transform(self, c, dr=0, dt=0, dz=0):
         """Transform from spectral domain to physical.
 
@@ -465,19 +525,7 @@ class Transform(IOAble):
         x : ndarray, shape(num_nodes,)
             array of values of function at node locations
         """
-        if not self.built:
-            raise RuntimeError(
-                "Transform must be precomputed with transform.build() before being used"
-            )
-
-        if self.basis.num_modes != c.size:
-            raise ValueError(
-                colored(
-                    "Coefficients dimension ({}) is incompatible with ".format(c.size)
-                    + "the number of basis modes({})".format(self.basis.num_modes),
-                    "red",
-                )
-            )
+        self._check_coefficients(c)
 
         if len(c) == 0:
             return np.zeros(self.grid.num_nodes)
@@ -491,46 +539,66 @@ class Transform(IOAble):
             return A @ c
 
         elif self.method == "direct2":
-            A = self.matrices["fft"].get(dr, {}).get(dt, {})
-            B = self.matrices["direct2"].get(dz, {})
-            if isinstance(A, dict) or isinstance(B, dict):
-                raise ValueError(
-                    colored("Derivative orders are out of initialized bounds", "red")
-                )
-            c_mtrx = jnp.zeros((self.num_lm_modes * self.num_n_modes,))
-            c_mtrx = put(c_mtrx, self.fft_index, c).reshape((-1, self.num_n_modes))
-            cc = A @ c_mtrx
+            A = self._get_fft_matrix(dr, dt)
+            B = self._get_direct2_matrix(dz)
+            cc = A @ self._coefficient_matrix(c)
             return (cc @ B.T).flatten(order="F")
 
         elif self.method == "fft":
-            A = self.matrices["fft"].get(dr, {}).get(dt, {})
-            if isinstance(A, dict):
-                raise ValueError(
-                    colored("Derivative orders are out of initialized bounds", "red")
-                )
-            # reshape coefficients
-            c_mtrx = jnp.zeros((self.num_lm_modes * self.num_n_modes,))
-            c_mtrx = put(c_mtrx, self.fft_index, c).reshape((-1, self.num_n_modes))
-            # differentiate
-            c_diff = c_mtrx[:, :: (-1) ** dz] * self.dk**dz * (-1) ** (dz > 1)
-            # re-format in complex notation
-            c_real = jnp.pad(
-                (self.num_z_nodes / 2)
-                * (c_diff[:, self.N + 1 :] - 1j * c_diff[:, self.N - 1 :: -1]),
-                ((0, 0), (0, self.pad_dim)),
-                mode="constant",
-            )
-            c_cplx = jnp.hstack(
-                (
-                    self.num_z_nodes * c_diff[:, self.N, jnp.newaxis],
-                    c_real,
-                    jnp.fliplr(jnp.conj(c_real)),
-                )
-            )
-            # transform coefficients
-            c_fft = jnp.real(jnp.fft.ifft(c_cplx))
+            A = self._get_fft_matrix(dr, dt)
+            c_fft = self._fft_coefficients(self._coefficient_matrix(c), dz)
             return (A @ c_fft).flatten(order="F")
 
+    def transform_batch(self, c, derivs):
+        """Transform from spectral domain to physical for several derivative orders.
+
+        Same as stacking ``transform(c, *d)`` for each ``d`` in ``derivs``, but work
+        that depends only on the coefficients, or only on some of the derivative
+        orders, is done once and shared between the derivatives.
+
+        Parameters
+        ----------
+        c : ndarray, shape(num_coeffs,)
+            spectral coefficients, indexed to correspond to the spectral basis
+        derivs : array-like of int, shape(num_derivs, 3)
+            Each row is one set of derivative orders [dr, dt, dz].
+
+        Returns
+        -------
+        x : ndarray, shape(num_derivs, num_nodes)
+            array of values of function at node locations, for each derivative
+        """
+        derivs = np.atleast_2d(derivs).astype(int)
+        self._check_coefficients(c)
+
+        if len(c) == 0:
+            return np.zeros((derivs.shape[0], self.grid.num_nodes))
+
+        if self.method in ["direct1", "jitable"]:
+            return jnp.stack([self.transform(c, *d) for d in derivs])
+
+        c_mtrx = self._coefficient_matrix(c)
+        x = []
+        if self.method == "direct2":
+            # the radial and poloidal part is shared by all toroidal derivatives
+            cc = {}
+            for dr, dt, dz in derivs:
+                if (dr, dt) not in cc:
+                    cc[(dr, dt)] = self._get_fft_matrix(dr, dt) @ c_mtrx
+                B = self._get_direct2_matrix(dz)
+                x.append((cc[(dr, dt)] @ B.T).flatten(order="F"))
+
+        elif self.method == "fft":
+            # the FFT is shared by all radial and poloidal derivatives
+            c_fft = {}
+            for dr, dt, dz in derivs:
+                A = self._get_fft_matrix(dr, dt)
+                if dz not in c_fft:
+                    c_fft[dz] = self._fft_coefficients(c_mtrx, dz)
+                x.append((A @ c_fft[dz]).flatten(order="F"))
+
+        return jnp.stack(x)
+
     def fit(self, x):
         """Transform from physical domain to spectral using weighted least squares fit.
 
@@ -712,6 +780,23 @@ class Transform(IOAble):
         """
         return self._derivatives
 
+    def has_derivatives(self, derivs):
+        """Whether the transform can compute all of the given derivatives.
+
+        Parameters
+        ----------
+        derivs : array-like of int, shape(num_derivs, 3)
+            Each row is one set of derivative orders [dr, dt, dz].
+
+        Returns
+        -------
+        has_derivatives : bool
+            True if every row of derivs is in self.derivatives.
+
+        """
+        derivs = np.asarray(derivs).reshape((-1, 3))
+        return bool((derivs[:, None] == self.derivatives).all(-1).any(-1).all())
+
     def change_derivatives(self, derivs, build=True):
         """Change the order and updates the matrices accordingly.
 
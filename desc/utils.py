@@ -9,7 +9,7 @@ import numpy as np
 from scipy.special import factorial
 from termcolor import colored
 
-from desc.backend import flatnonzero, fori_loop, jit, jnp, take
+from desc.backend import flatnonzero, jnp, put, take
 
 
 class Timer:
@@ -373,11 +373,10 @@ def islinspaced(x, axis=-1, rtol=1e-6, atol=1e-12):
     return isalmostequal(np.diff(x, axis=axis), rtol=rtol, atol=atol, axis=axis)
 
 
-@jit
 def copy_coeffs(c_old, modes_old, modes_new, c_new=None):
     """Copy coefficients from one resolution to another."""
-    modes_old, modes_new = jnp.atleast_1d(jnp.asarray(modes_old)), jnp.atleast_1d(
-        jnp.asarray(modes_new)
+    modes_old, modes_new = np.atleast_1d(np.asarray(modes_old)), np.atleast_1d(
+        np.asarray(modes_new)
     )
 
     if modes_old.ndim == 1:
@@ -387,15 +386,21 @@ def copy_coeffs(c_old, modes_old, modes_new, c_new=None):
 
     if c_new is None:
         c_new = jnp.zeros((modes_new.shape[0],))
-    c_old, c_new = jnp.asarray(c_old), jnp.asarray(c_new)
-
-    def body(i, c_new):
-        mask = (modes_old[i, :] == modes_new).all(axis=1)
-        c_new = jnp.where(mask, c_old[i], c_new)
-        return c_new
+    c_old, c_new = jnp.asarray(c_old), jnp.array(c_new)
 
     if c_old.size:
-        c_new = fori_loop(0, modes_old.shape[0], body, c_new)
+        # label every distinct mode with an integer, then map each new mode to the
+        # position of the same mode in the old modes (-1 if it is not there)
+        _, label = np.unique(
+            np.vstack([modes_old, modes_new]), axis=0, return_inverse=True
+        )
+        label = label.ravel()
+        num_old = modes_old.shape[0]
+        old_idx = np.full(label.max() + 1, -1)
+        old_idx[label[:num_old]] = np.arange(num_old)
+        old_idx = old_idx[label[num_old:]]
+        new_idx = np.flatnonzero(old_idx >= 0)
+        c_new = put(c_new, new_idx, c_old[old_idx[new_idx]])
     return c_new
 
 
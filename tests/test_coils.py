@@ -499,6 +499,25 @@ class TestCoilSet:
         B_normal, _ = coils.compute_Bnormal(surf)
         np.testing.assert_allclose(B_normal, 0, atol=1e-9)
 
+    @pytest.mark.unit
+    def test_field_prime_number_of_coils(self):
+        """Field from a number of coils that does not fill whole batches."""
+        coil = FourierPlanarCoil(r_n=1)
+        coils = CoilSet.linspaced_angular(
+            coil, current=np.linspace(1e6, 2e6, 11), n=11
+        )
+        coords = np.array([[10, 0, 0], [10.5, 0.3, 0.2], [9.5, 1.2, -0.1]])
+        for basis in ["rpz", "xyz"]:
+            B = coils.compute_magnetic_field(coords, basis=basis, source_grid=32)
+            B_true = np.sum(
+                [
+                    c.compute_magnetic_field(coords, basis=basis, source_grid=32)
+                    for c in coils
+                ],
+                axis=0,
+            )
+            np.testing.assert_allclose(B, B_true, rtol=1e-10, atol=1e-12)
+
     @pytest.mark.unit
     def test_from_symmetry(self):
         """Same toroidal solenoid field, but different construction."""
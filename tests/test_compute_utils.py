@@ -5,7 +5,12 @@ import numpy as np
 import pytest
 
 from desc.backend import jnp
+from desc.compute import compute as compute_fun
+from desc.compute import get_params, get_profiles, get_transforms
 from desc.compute.geom_utils import rotation_matrix
+from desc.compute.utils import cross, dot, triple
+from desc.equilibrium import Equilibrium
+from desc.grid import LinearGrid
 
 
 @pytest.mark.unit
@@ -18,3 +23,31 @@ def test_rotation_matrix():
     np.testing.assert_allclose(rotation_matrix(x0), np.eye(3))
     np.testing.assert_allclose(dfdx_fwd(x0), np.zeros((3, 3, 3)))
     np.testing.assert_allclose(dfdx_rev(x0), np.zeros((3, 3, 3)))
+
+
+@pytest.mark.unit
+def test_triple():
+    """Test that triple agrees with dot and cross for batched vectors."""
+    rng = np.random.default_rng(0)
+    a, b, c = rng.standard_normal((3, 2, 10, 3))
+    np.testing.assert_allclose(triple(a, b, c), dot(a, cross(b, c)))
+    np.testing.assert_allclose(triple(a, b, c), np.linalg.det(np.stack([a, b, c], -2)))
+
+
+@pytest.mark.unit
+def test_compute_reuses_data():
+    """Test that dependencies already in data are reused instead of recomputed."""
+    eq = Equilibrium()
+    grid = LinearGrid(rho=0.5, M=eq.M_grid, N=eq.N_grid, NFP=eq.NFP)
+    names = ["R", "sqrt(g)"]
+    kwargs = dict(
+        parameterization="desc.equilibrium.equilibrium.Equilibrium",
+        params=get_params(names, eq),
+        transforms=get_transforms(names, eq, grid),
+        profiles=get_profiles(names, eq, grid),
+    )
+    data = compute_fun(names=names, **kwargs)
+    # sqrt(g) is proportional to R, so a scaled R should propagate through
+    data2 = compute_fun(names="sqrt(g)", data={"R": 2 * data["R"]}, **kwargs)
+    np.testing.assert_allclose(data2["R"], 2 * data["R"])
+    np.testing.assert_allclose(data2["sqrt(g)"], 2 * data["sqrt(g)"])
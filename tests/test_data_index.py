@@ -1,5 +1,6 @@
 """Tests for things related to data_index."""
 
+import ast
 import inspect
 import re
 
@@ -135,3 +136,21 @@ def test_data_index_deps():
                 assert queried_deps[p][name]["data"] == data | axis_limit_data, err_msg
             assert queried_deps[p][name]["profiles"] == profiles, err_msg
             assert queried_deps[p][name]["params"] == params, err_msg
+
+
+@pytest.mark.unit
+def test_no_discarded_expressions():
+    """Ensure compute functions don't silently discard part of an expression.
+
+    If a multi-line expression is not wrapped in parentheses, the continuation
+    lines become a separate statement that is evaluated and thrown away.
+    """
+    for module_name, module in inspect.getmembers(desc.compute, inspect.ismodule):
+        if module_name[0] == "_":
+            for node in ast.walk(ast.parse(inspect.getsource(module))):
+                errorif(
+                    isinstance(node, ast.Expr)
+                    and isinstance(node.value, (ast.BinOp, ast.UnaryOp)),
+                    AssertionError,
+                    f"Discarded expression in {module_name} on line {node.lineno}.",
+                )
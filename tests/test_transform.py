@@ -389,6 +389,35 @@ class TestTransform:
                 err_msg="failed on double fourier after change, d={}".format(d),
             )
 
+    @pytest.mark.unit
+    def test_transform_batch(self):
+        """Tests that transform_batch matches transform for each derivative."""
+        grid = ConcentricGrid(8, 4, 3, NFP=4)
+        basis = FourierZernikeBasis(L=4, M=3, N=2, NFP=4)
+        x = np.random.random(basis.num_modes)
+        for method in ["direct1", "direct2", "fft"]:
+            transf = Transform(grid, basis, derivs=2, method=method)
+            y = transf.transform_batch(x, transf.derivatives)
+            assert y.shape == (len(transf.derivatives), grid.num_nodes)
+            for d, yd in zip(transf.derivatives, y):
+                np.testing.assert_allclose(
+                    yd,
+                    transf.transform(x, *d),
+                    err_msg="failed on {}, d={}".format(method, d),
+                )
+
+    @pytest.mark.unit
+    def test_has_derivatives(self):
+        """Tests checking whether a transform has the needed derivatives."""
+        grid = LinearGrid(M=2, N=2)
+        basis = DoubleFourierSeries(M=2, N=2)
+        transf = Transform(grid, basis, derivs=np.array([[0, 1, 0], [0, 0, 2]]))
+        assert transf.has_derivatives([0, 0, 0])
+        assert transf.has_derivatives([[0, 1, 0], [0, 0, 2]])
+        assert not transf.has_derivatives([[0, 1, 0], [0, 0, 1]])
+        transf.change_derivatives([[0, 0, 1]])
+        assert transf.has_derivatives([[0, 1, 0], [0, 0, 1]])
+
     @pytest.mark.unit
     def test_project(self):
         """Tests projection method for Galerkin method."""
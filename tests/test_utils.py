@@ -7,7 +7,13 @@ import pytest
 
 from desc.backend import flatnonzero, jnp, tree_leaves, tree_structure
 from desc.grid import LinearGrid
-from desc.utils import broadcast_tree, isalmostequal, islinspaced, take_mask
+from desc.utils import (
+    broadcast_tree,
+    copy_coeffs,
+    isalmostequal,
+    islinspaced,
+    take_mask,
+)
 
 
 @pytest.mark.unit
@@ -231,3 +237,24 @@ def test_take_mask():
             desired[-1] if desired.size else np.nan,
             equal_nan=True,
         )
+
+
+@pytest.mark.unit
+def test_copy_coeffs():
+    """Test copying coefficients between mode sets of different resolution."""
+    modes_old = np.array([[0, 0, 0], [1, 1, 0], [2, 2, -1]])
+    c_old = np.array([1.0, 2.0, 3.0])
+    modes_new = np.array([[1, 1, 0], [0, 0, 0], [3, 3, 0], [2, 2, -1], [2, 2, 1]])
+    np.testing.assert_array_equal(
+        copy_coeffs(c_old, modes_old, modes_new), [2.0, 1.0, 0.0, 3.0, 0.0]
+    )
+    # modes that are not in the old set keep the values of c_new
+    c_new = np.full(5, -1.0)
+    np.testing.assert_array_equal(
+        copy_coeffs(c_old, modes_old, modes_new, c_new), [2.0, 1.0, -1.0, 3.0, -1.0]
+    )
+    np.testing.assert_array_equal(c_new, -1.0)
+    # 1D mode numbers
+    np.testing.assert_array_equal(
+        copy_coeffs([4.0, 5.0], [-1, 1], [0, 1, -1, 2]), [0.0, 5.0, 4.0, 0.0]
+    )